@@ -76,3 +76,16 @@ class TestConfig:
         assert nested_input.exists()
         assert nested_input.is_dir()
 
+    
+    def test_ensure_directories_only_once(self, tmp_path):
+        """Test that repeated calls do not touch the filesystem again."""
+        config = Config(
+            input_path=str(tmp_path / "input"),
+            output_path=str(tmp_path / "output")
+        )
+        config.ensure_directories()
+        
+        with patch.object(Path, 'mkdir') as mock_mkdir:
+            config.ensure_directories()
+        
+        mock_mkdir.assert_not_called()
@@ -4,7 +4,9 @@ import pytest
 import yaml
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from unittest.mock import patch
 
+from tonuino_organizer import description
 from tonuino_organizer.description import (
     load_description,
     get_description_type,
@@ -110,6 +112,18 @@ class TestLoadDescription:
         with pytest.raises(DescriptionError, match="must be a number"):
             load_description(tmp_path)
     
+    def test_boolean_min_duration(self, tmp_path):
+        """Test that a boolean min_duration is not accepted as a number."""
+        desc_file = tmp_path / "description.yaml"
+        desc_file.write_text(
+            "type: rss\n"
+            "feed_url: https://example.com/feed.xml\n"
+            "min_duration: yes\n"
+        )
+        
+        with pytest.raises(DescriptionError, match="must be a number"):
+            load_description(tmp_path)
+    
     def test_negative_min_duration(self, tmp_path):
         """Test that negative min_duration raises error."""
         desc_file = tmp_path / "description.yaml"
@@ -141,6 +155,21 @@ class TestLoadDescription:
         
         with pytest.raises(DescriptionError, match="must contain a YAML dictionary"):
             load_description(tmp_path)
+    
+    def test_uses_libyaml_loader_when_available(self):
+        """Test that the libyaml-backed loader is used if PyYAML provides it."""
+        if not hasattr(yaml, "CSafeLoader"):
+            pytest.skip("PyYAML built without libyaml")
+        assert description.YamlLoader is yaml.CSafeLoader
+    
+    def test_pure_python_loader_gives_same_result(self, tmp_path):
+        """Test that the SafeLoader fallback parses descriptions identically."""
+        desc_file = tmp_path / "description.yaml"
+        desc_file.write_text("type: rss\nfeed_url: https://example.com/feed.xml\nmin_duration: 90.5\n")
+        
+        data = load_description(tmp_path)
+        with patch('tonuino_organizer.description.YamlLoader', yaml.SafeLoader):
+            assert load_description(tmp_path) == data
 
 
 class TestGetDescriptionType:
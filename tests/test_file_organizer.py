@@ -1,11 +1,12 @@
 """Tests for file_organizer module."""
 
+import os
 import pytest
 import shutil
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from tonuino_organizer.file_organizer import organize_files
+from tonuino_organizer.file_organizer import organize_files, copy_file
 from tonuino_organizer.utils import extract_two_digit_prefix
 
 
@@ -85,6 +86,87 @@ class TestOrganizeFiles:
             expected_name = f"{i:03d}.mp3"
             assert (output_folder / expected_name).exists()
     
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_organize_files_keeps_order(self, tmp_path, max_workers):
+        """Test that numbering follows input order regardless of worker count."""
+        input_dir = tmp_path / "input" / "01_Album"
+        input_dir.mkdir(parents=True)
+        
+        files = []
+        for i in range(20):
+            file_path = input_dir / f"song{i}.mp3"
+            file_path.write_bytes(f"content {i}".encode())
+            files.append(file_path)
+        
+        output_dir = tmp_path / "output"
+        
+        copied_files = organize_files(
+            files, "01_Album", output_dir, max_workers=max_workers
+        )
+        
+        output_folder = output_dir / "01"
+        assert copied_files == [output_folder / f"{i:03d}.mp3" for i in range(1, 21)]
+        for i, copied in enumerate(copied_files):
+            assert copied.read_bytes() == f"content {i}".encode()
+    
+    def test_organize_files_copies_one_at_a_time_by_default(self, tmp_path):
+        """Test that files are created in numbering order by default (FAT order)."""
+        input_dir = tmp_path / "input" / "01_Album"
+        input_dir.mkdir(parents=True)
+        files = []
+        for i in range(20):
+            file_path = input_dir / f"song{i:02d}.mp3"
+            file_path.write_bytes(b"content")
+            files.append(file_path)
+        
+        with patch('tonuino_organizer.file_organizer.copy_file') as mock_copy:
+            organize_files(files, "01_Album", tmp_path / "output")
+        
+        created = [os.path.basename(args[1]) for args, _ in mock_copy.call_args_list]
+        assert created == [f"{i:03d}.mp3" for i in range(1, 21)]
+    
+    def test_organize_files_lists_copies_in_order(self, tmp_path):
+        """Test that copied files are listed in numbering order after copying."""
+        input_dir = tmp_path / "input" / "01_Album"
+        input_dir.mkdir(parents=True)
+        
+        files = []
+        for i in range(10):
+            file_path = input_dir / f"song{i}.mp3"
+            file_path.write_bytes(b"content")
+            files.append(file_path)
+        
+        with patch('tonuino_organizer.file_organizer.console.print') as mock_print:
+            organize_files(files, "01_Album", tmp_path / "output", max_workers=4)
+        
+        # Progress itself prints control codes through the console as well
+        lines = [
+            args[0] for args, _ in mock_print.call_args_list
+            if args and isinstance(args[0], str)
+        ]
+        assert len(lines) == 10
+        for i, line in enumerate(lines):
+            assert f"song{i}.mp3 → {i + 1:03d}.mp3" in line
+    
+    def test_organize_files_stops_after_copy_error(self, tmp_path):
+        """Test that remaining copies are cancelled after the first error."""
+        input_dir = tmp_path / "input" / "01_Album"
+        input_dir.mkdir(parents=True)
+        files = []
+        for i in range(10):
+            file_path = input_dir / f"song{i:02d}.mp3"
+            file_path.write_bytes(b"content")
+            files.append(file_path)
+        
+        output_dir = tmp_path / "output"
+        
+        with patch('tonuino_organizer.file_organizer.copy_file',
+                   side_effect=OSError("No space left on device")) as mock_copy:
+            with pytest.raises(OSError, match="No space left on device"):
+                organize_files(files, "01_Album", output_dir, max_workers=1)
+        
+        assert mock_copy.call_count == 1
+    
     def test_organize_files_too_many_files(self, tmp_path):
         """Test that more than 255 files raises error."""
         input_dir = tmp_path / "input" / "01_Album"
@@ -148,6 +230,20 @@ class TestOrganizeFiles:
         # Check that file was overwritten
         assert existing_file.read_bytes() == b"new content"
     
+    def test_organize_files_recreates_removed_output_directory(self, tmp_path):
+        """Test that an output directory removed between runs is created again."""
+        input_dir = tmp_path / "input" / "01_Album"
+        input_dir.mkdir(parents=True)
+        file1 = input_dir / "song1.mp3"
+        file1.write_bytes(b"content")
+        output_dir = tmp_path / "output"
+        
+        organize_files([file1], "01_Album", output_dir)
+        shutil.rmtree(output_dir)
+        organize_files([file1], "01_Album", output_dir)
+        
+        assert (output_dir / "01" / "001.mp3").read_bytes() == b"content"
+    
     def test_organize_files_creates_output_directory(self, tmp_path):
         """Test that output directory is created if it doesn't exist."""
         input_dir = tmp_path / "input" / "01_Album"
@@ -164,3 +260,55 @@ class TestOrganizeFiles:
         assert output_dir.exists()
         assert (output_dir / "01" / "001.mp3").exists()
 
+
+
+class TestCopyFile:
+    """Tests for copy_file function."""
+    
+    def test_copy_file_copies_content_and_mtime(self, tmp_path):
+        """Test that content and modification time are copied."""
+        source = tmp_path / "source.mp3"
+        source.write_bytes(b"fake mp3 content" * 1000)
+        os.utime(source, (1000000000, 1000000000))
+        dest = tmp_path / "dest.mp3"
+        
+        copy_file(source, dest)
+        
+        assert dest.read_bytes() == source.read_bytes()
+        assert dest.stat().st_mtime == source.stat().st_mtime
+    
+    def test_copy_file_falls_back_on_os_error(self, tmp_path):
+        """Test fallback to shutil.copyfile when copy_file_range fails."""
+        source = tmp_path / "source.mp3"
+        source.write_bytes(b"fake mp3 content")
+        dest = tmp_path / "dest.mp3"
+        
+        with patch('tonuino_organizer.file_organizer._HAS_COPY_FILE_RANGE', True), \
+                patch('tonuino_organizer.file_organizer._copy_file_range',
+                      side_effect=OSError("EXDEV")):
+            copy_file(source, dest)
+        
+        assert dest.read_bytes() == b"fake mp3 content"
+    
+    def test_copy_file_onto_itself_raises(self, tmp_path):
+        """Test that copying a file onto itself fails instead of emptying it."""
+        source = tmp_path / "source.mp3"
+        source.write_bytes(b"fake mp3 content")
+        
+        with pytest.raises(shutil.SameFileError):
+            copy_file(source, tmp_path / "." / "source.mp3")
+        
+        assert source.read_bytes() == b"fake mp3 content"
+    
+    def test_copy_file_falls_back_on_short_copy(self, tmp_path):
+        """Test fallback to shutil.copyfile when copy_file_range copies nothing."""
+        source = tmp_path / "source.mp3"
+        source.write_bytes(b"fake mp3 content" * 1000)
+        dest = tmp_path / "dest.mp3"
+        
+        with patch('tonuino_organizer.file_organizer._HAS_COPY_FILE_RANGE', True), \
+                patch('tonuino_organizer.file_organizer.os.copy_file_range',
+                      return_value=0, create=True):
+            copy_file(source, dest)
+        
+        assert dest.read_bytes() == source.read_bytes()
@@ -1,11 +1,32 @@
 """Tests for podcast_handler module."""
 
+import hashlib
+import time
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock, Mock
 from io import BytesIO
+from types import SimpleNamespace
 
-from tonuino_organizer.podcast_handler import PodcastHandler, process_podcast, DEFAULT_MIN_DURATION_SECONDS
+import feedparser
+
+from tonuino_organizer.podcast_handler import (
+    PodcastHandler,
+    process_podcast,
+    DEFAULT_MIN_DURATION_SECONDS,
+    _extract_audio_url,
+    _extract_audio_length,
+    _parse_itunes_duration,
+)
+
+
+class _FakeMPEGInfo:
+    """Stand-in for mutagen's MPEGInfo (plain attribute, unlike MagicMock)."""
+    
+    __slots__ = ("length",)
+    
+    def __init__(self, length: float):
+        self.length = length
 
 
 class TestPodcastHandler:
@@ -38,6 +59,20 @@ class TestPodcastHandler:
         assert len(handler.downloaded_urls) == 2
         assert "https://example.com/ep1.mp3" in handler.downloaded_urls
     
+    def test_load_tracking_files_strips_whitespace(self, tmp_path):
+        """Test that padded and whitespace-only tracking lines are handled."""
+        for name in (".downloaded_files", ".rejected_files"):
+            (tmp_path / name).write_text(
+                "https://example.com/ep1.mp3  \r\n"
+                "   \n"
+                "\thttps://example.com/ep2.mp3\n"
+            )
+        
+        handler = PodcastHandler(tmp_path)
+        expected = {"https://example.com/ep1.mp3", "https://example.com/ep2.mp3"}
+        assert handler.downloaded_urls == expected
+        assert handler.rejected_urls == expected
+    
     def test_load_rejected_urls(self, tmp_path):
         """Test loading rejected URLs from file."""
         rejected_file = tmp_path / ".rejected_files"
@@ -52,8 +87,8 @@ class TestPodcastHandler:
     
     def test_save_downloaded_url(self, tmp_path):
         """Test saving downloaded URL."""
-        handler = PodcastHandler(tmp_path)
-        handler._save_downloaded_url("https://example.com/ep1.mp3")
+        with PodcastHandler(tmp_path) as handler:
+            handler._save_downloaded_url("https://example.com/ep1.mp3")
         
         assert "https://example.com/ep1.mp3" in handler.downloaded_urls
         downloaded_file = tmp_path / ".downloaded_files"
@@ -62,21 +97,71 @@ class TestPodcastHandler:
     
     def test_save_rejected_url(self, tmp_path):
         """Test saving rejected URL."""
-        handler = PodcastHandler(tmp_path)
-        handler._save_rejected_url("https://example.com/short.mp3")
+        with PodcastHandler(tmp_path) as handler:
+            handler._save_rejected_url("https://example.com/short.mp3")
         
         assert "https://example.com/short.mp3" in handler.rejected_urls
         rejected_file = tmp_path / ".rejected_files"
         assert rejected_file.exists()
         assert "https://example.com/short.mp3" in rejected_file.read_text()
     
-    @patch('tonuino_organizer.podcast_handler.MP3')
-    def test_get_mp3_duration(self, mock_mp3_class, tmp_path):
+    def test_deferred_writes_are_flushed_together(self, tmp_path):
+        """Test that deferred tracking lines are only written on flush()."""
+        with PodcastHandler(tmp_path) as handler:
+            handler._defer_tracking_writes = True
+            handler._save_downloaded_url("https://example.com/ep1.mp3")
+            handler._save_url_mapping("https://example.com/ep1.mp3", 1)
+            
+            assert "https://example.com/ep1.mp3" in handler.downloaded_urls
+            assert not (tmp_path / ".downloaded_files").exists()
+            
+            handler.flush()
+        
+        assert (tmp_path / ".downloaded_files").read_text() == "https://example.com/ep1.mp3\n"
+        assert (tmp_path / ".url_mapping").read_text() == "https://example.com/ep1.mp3|1\n"
+    
+    @patch('tonuino_organizer.podcast_handler.TRACKING_FLUSH_INTERVAL', 2)
+    def test_deferred_writes_flushed_after_interval(self, tmp_path):
+        """Test that deferred lines are written once the flush interval is reached."""
+        with PodcastHandler(tmp_path) as handler:
+            handler._defer_tracking_writes = True
+            handler._save_downloaded_url("https://example.com/ep1.mp3")
+            assert not (tmp_path / ".downloaded_files").exists()
+            
+            handler._save_downloaded_url("https://example.com/ep2.mp3")
+            assert len((tmp_path / ".downloaded_files").read_text().splitlines()) == 2
+    
+    def test_close_keeps_saved_urls(self, tmp_path):
+        """Test that closing the handler releases handles and keeps saved URLs."""
+        handler = PodcastHandler(tmp_path)
+        handler._save_downloaded_url("https://example.com/ep1.mp3")
+        handler._save_downloaded_url("https://example.com/ep2.mp3")
+        handler.close()
+        
+        assert handler._tracking_handles == {}
+        reloaded = PodcastHandler(tmp_path)
+        assert reloaded.downloaded_urls == {
+            "https://example.com/ep1.mp3",
+            "https://example.com/ep2.mp3",
+        }
+    
+    def test_close_syncs_tracking_files(self, tmp_path):
+        """Test that tracking files are fsynced once when the handler is closed."""
+        handler = PodcastHandler(tmp_path)
+        handler._save_downloaded_url("https://example.com/ep1.mp3")
+        handler._save_url_mapping("https://example.com/ep1.mp3", 1)
+        
+        with patch('tonuino_organizer.podcast_handler.os.fsync') as mock_fsync:
+            handler.close()
+        
+        assert mock_fsync.call_count == 2
+    
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
+    def test_get_mp3_duration(self, mock_mpeg_info, tmp_path):
         """Test getting MP3 duration."""
         # Create mock audio object
-        mock_audio = MagicMock()
-        mock_audio.info.length = 120.5
-        mock_mp3_class.return_value = mock_audio
+        mock_info = _FakeMPEGInfo(120.5)
+        mock_mpeg_info.return_value = mock_info
         
         file_path = tmp_path / "test.mp3"
         file_path.touch()
@@ -85,12 +170,13 @@ class TestPodcastHandler:
         duration = handler._get_mp3_duration(file_path)
         
         assert duration == 120.5
-        mock_mp3_class.assert_called_once_with(file_path)
+        mock_mpeg_info.assert_called_once()
+        assert mock_mpeg_info.call_args[0][0].name == str(file_path)
     
-    @patch('tonuino_organizer.podcast_handler.MP3')
-    def test_get_mp3_duration_error(self, mock_mp3_class, tmp_path):
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
+    def test_get_mp3_duration_error(self, mock_mpeg_info, tmp_path):
         """Test getting MP3 duration when error occurs."""
-        mock_mp3_class.side_effect = Exception("File error")
+        mock_mpeg_info.side_effect = Exception("File error")
         
         file_path = tmp_path / "test.mp3"
         file_path.touch()
@@ -100,12 +186,46 @@ class TestPodcastHandler:
         
         assert duration == 0.0
     
-    @patch('tonuino_organizer.podcast_handler.MP3')
-    def test_is_file_too_short_true(self, mock_mp3_class, tmp_path):
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
+    def test_get_mp3_duration_cached_across_handlers(self, mock_mpeg_info, tmp_path):
+        """Test that durations are persisted and reused while the file is unchanged."""
+        mock_info = _FakeMPEGInfo(120.5)
+        mock_mpeg_info.return_value = mock_info
+        
+        file_path = tmp_path / "test.mp3"
+        file_path.write_bytes(b"fake mp3 content")
+        
+        with PodcastHandler(tmp_path) as handler:
+            assert handler._get_mp3_duration(file_path) == 120.5
+        assert (tmp_path / ".duration_cache").exists()
+        
+        mock_mpeg_info.side_effect = Exception("Should not be parsed again")
+        with PodcastHandler(tmp_path) as handler:
+            assert handler._get_mp3_duration(file_path) == 120.5
+    
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
+    def test_get_mp3_duration_cache_invalidated_on_change(self, mock_mpeg_info, tmp_path):
+        """Test that a changed file is parsed again."""
+        mock_info = _FakeMPEGInfo(120.5)
+        mock_mpeg_info.return_value = mock_info
+        
+        file_path = tmp_path / "test.mp3"
+        file_path.write_bytes(b"fake mp3 content")
+        
+        handler = PodcastHandler(tmp_path)
+        handler._get_mp3_duration(file_path)
+        
+        file_path.write_bytes(b"different, longer mp3 content")
+        mock_info.length = 200.0
+        
+        assert handler._get_mp3_duration(file_path) == 200.0
+        assert mock_mpeg_info.call_count == 2
+    
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
+    def test_is_file_too_short_true(self, mock_mpeg_info, tmp_path):
         """Test that file shorter than min_duration returns True."""
-        mock_audio = MagicMock()
-        mock_audio.info.length = 30.0  # 30 seconds
-        mock_mp3_class.return_value = mock_audio
+        mock_info = _FakeMPEGInfo(30.0)  # 30 seconds
+        mock_mpeg_info.return_value = mock_info
         
         file_path = tmp_path / "short.mp3"
         file_path.touch()
@@ -113,12 +233,11 @@ class TestPodcastHandler:
         handler = PodcastHandler(tmp_path, min_duration=60.0)
         assert handler._is_file_too_short(file_path) is True
     
-    @patch('tonuino_organizer.podcast_handler.MP3')
-    def test_is_file_too_short_false(self, mock_mp3_class, tmp_path):
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
+    def test_is_file_too_short_false(self, mock_mpeg_info, tmp_path):
         """Test that file longer than min_duration returns False."""
-        mock_audio = MagicMock()
-        mock_audio.info.length = 120.0  # 2 minutes
-        mock_mp3_class.return_value = mock_audio
+        mock_info = _FakeMPEGInfo(120.0)  # 2 minutes
+        mock_mpeg_info.return_value = mock_info
         
         file_path = tmp_path / "long.mp3"
         file_path.touch()
@@ -164,14 +283,19 @@ class TestPodcastHandler:
         
         assert handler.url_to_number["https://example.com/ep1.mp3"] == 1
         assert handler.url_to_number["https://example.com/ep2.mp3"] == 2
+        assert handler.number_to_url == {
+            1: "https://example.com/ep1.mp3",
+            2: "https://example.com/ep2.mp3",
+        }
     
     def test_save_url_mapping(self, tmp_path):
         """Test saving URL to number mapping."""
-        handler = PodcastHandler(tmp_path)
-        handler._save_url_mapping("https://example.com/ep1.mp3", 1)
+        with PodcastHandler(tmp_path) as handler:
+            handler._save_url_mapping("https://example.com/ep1.mp3", 1)
         
         assert "https://example.com/ep1.mp3" in handler.url_to_number
         assert handler.url_to_number["https://example.com/ep1.mp3"] == 1
+        assert handler.number_to_url[1] == "https://example.com/ep1.mp3"
         
         mapping_file = tmp_path / ".url_mapping"
         assert mapping_file.exists()
@@ -223,6 +347,26 @@ class TestPodcastHandler:
         )
         assert filename == "005_episode.mp3"
     
+    def test_get_filename_from_url_sanitizes_title(self, tmp_path):
+        """Test that unsafe characters are removed from title-based filenames."""
+        handler = PodcastHandler(tmp_path)
+        
+        filename = handler._get_filename_from_url(
+            "https://example.com/play?id=1",
+            " Folge 3: Märchen/Wald - Teil_1?! "
+        )
+        assert filename == "Folge_3_MärchenWald_-_Teil_1.mp3"
+    
+    def test_get_filename_from_url_without_title(self, tmp_path):
+        """Test that URLs without filename or title get a checksum-based name."""
+        handler = PodcastHandler(tmp_path)
+        
+        filename = handler._get_filename_from_url("https://example.com/play?id=1")
+        assert filename.startswith("episode_") and filename.endswith(".mp3")
+        assert len(filename) == len("episode_12345678.mp3")
+        assert filename == handler._get_filename_from_url("https://example.com/play?id=1")
+        assert filename != handler._get_filename_from_url("https://example.com/play?id=2")
+    
     def test_get_numbered_filename_removes_existing_prefix(self, tmp_path):
         """Test that existing three-digit prefix is removed."""
         handler = PodcastHandler(tmp_path)
@@ -238,8 +382,9 @@ class TestPodcastHandler:
         assert "001_" not in filename  # Original prefix should be removed
     
     
-    @patch('tonuino_organizer.podcast_handler.MP3')
-    def test_get_local_files_removes_short_files(self, mock_mp3_class, tmp_path):
+    @pytest.mark.parametrize("scan_workers", [1, 8])
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
+    def test_get_local_files_removes_short_files(self, mock_mpeg_info, tmp_path, scan_workers):
         """Test that get_local_files removes files that are too short."""
         # Create files
         short_file = tmp_path / "short.mp3"
@@ -248,17 +393,14 @@ class TestPodcastHandler:
         long_file.touch()
         
         # Mock duration responses
-        def mock_mp3_side_effect(path):
-            mock = MagicMock()
-            if path == short_file:
-                mock.info.length = 30.0  # Too short
-            else:
-                mock.info.length = 120.0  # Long enough
-            return mock
+        def mock_mpeg_info_side_effect(fileobj):
+            if Path(fileobj.name) == short_file:
+                return _FakeMPEGInfo(30.0)  # Too short
+            return _FakeMPEGInfo(120.0)  # Long enough
         
-        mock_mp3_class.side_effect = mock_mp3_side_effect
+        mock_mpeg_info.side_effect = mock_mpeg_info_side_effect
         
-        handler = PodcastHandler(tmp_path, min_duration=60.0)
+        handler = PodcastHandler(tmp_path, min_duration=60.0, scan_workers=scan_workers)
         mp3_files = handler.get_local_files()
         
         # Short file should be removed, only long file remains
@@ -288,14 +430,14 @@ class TestPodcastHandler:
         downloaded_files = handler.download_episodes("https://example.com/feed.xml")
         
         # Should not download again
-        mock_requests.get.assert_not_called()
+        mock_requests.Session.return_value.get.assert_not_called()
         assert len(downloaded_files) == 0
     
-    @patch('tonuino_organizer.podcast_handler.MP3')
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
     @patch('tonuino_organizer.podcast_handler.feedparser')
     @patch('tonuino_organizer.podcast_handler.requests')
     def test_download_episodes_rejects_short_files(
-        self, mock_requests, mock_feedparser, mock_mp3_class, tmp_path
+        self, mock_requests, mock_feedparser, mock_mpeg_info, tmp_path
     ):
         """Test that short files are rejected after download."""
         # Set up feed
@@ -309,15 +451,14 @@ class TestPodcastHandler:
         
         # Mock download response
         mock_response = MagicMock()
-        mock_response.headers = {'content-length': '1000'}
+        mock_response.headers = {'content-length': '1000000'}
         mock_response.iter_content.return_value = [b"fake mp3 content"]
         mock_response.raise_for_status.return_value = None
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
         
         # Mock MP3 duration - return short duration
-        mock_audio = MagicMock()
-        mock_audio.info.length = 30.0  # Too short
-        mock_mp3_class.return_value = mock_audio
+        mock_info = _FakeMPEGInfo(30.0)  # Too short
+        mock_mpeg_info.return_value = mock_info
         
         handler = PodcastHandler(tmp_path, min_duration=60.0)
         downloaded_files = handler.download_episodes("https://example.com/feed.xml")
@@ -328,11 +469,117 @@ class TestPodcastHandler:
         # URL should be in rejected list
         assert "https://example.com/short.mp3" in handler.rejected_urls
     
-    @patch('tonuino_organizer.podcast_handler.MP3')
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
+    @patch('tonuino_organizer.podcast_handler.feedparser')
+    @patch('tonuino_organizer.podcast_handler.requests')
+    def test_download_episodes_rejects_short_files_by_content_length(
+        self, mock_requests, mock_feedparser, mock_mpeg_info, tmp_path
+    ):
+        """Test that files too small for min_duration are rejected before download."""
+        mock_feed = MagicMock()
+        mock_entry = MagicMock()
+        mock_entry.get.return_value = "Trailer"
+        mock_entry.enclosures = [{'type': 'audio/mpeg', 'href': 'https://example.com/trailer.mp3'}]
+        mock_feed.entries = [mock_entry]
+        mock_feed.bozo = False
+        mock_feedparser.parse.return_value = mock_feed
+        
+        # 50 KB play at most 50 seconds, even at the lowest MP3 bitrate
+        mock_response = MagicMock()
+        mock_response.headers = {'content-length': '50000'}
+        mock_response.raise_for_status.return_value = None
+        mock_requests.Session.return_value.get.return_value = mock_response
+        
+        handler = PodcastHandler(tmp_path, min_duration=60.0)
+        downloaded_files = handler.download_episodes("https://example.com/feed.xml")
+        
+        assert downloaded_files == []
+        assert "https://example.com/trailer.mp3" in handler.rejected_urls
+        mock_response.iter_content.assert_not_called()
+        mock_mpeg_info.assert_not_called()
+        assert list(tmp_path.glob("*trailer*")) == []
+    
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
+    @patch('tonuino_organizer.podcast_handler.feedparser')
+    @patch('tonuino_organizer.podcast_handler.requests')
+    def test_download_episodes_skips_short_itunes_duration(
+        self, mock_requests, mock_feedparser, mock_mpeg_info, tmp_path
+    ):
+        """Test that episodes listed as too short in the feed are not downloaded."""
+        mock_feed = MagicMock()
+        short_entry = MagicMock()
+        short_entry.get.side_effect = {'title': "Trailer", 'itunes_duration': "0:45"}.get
+        # 720 kB matches 45 seconds at 128 kbps
+        short_entry.enclosures = [
+            {'type': 'audio/mpeg', 'href': 'https://example.com/trailer.mp3', 'length': '720000'}
+        ]
+        long_entry = MagicMock()
+        long_entry.get.side_effect = {'title': "Episode 1", 'itunes_duration': "30:00"}.get
+        long_entry.enclosures = [{'type': 'audio/mpeg', 'href': 'https://example.com/ep1.mp3'}]
+        mock_feed.entries = [long_entry, short_entry]
+        mock_feed.bozo = False
+        mock_feedparser.parse.return_value = mock_feed
+        
+        mock_response = MagicMock()
+        mock_response.headers = {'content-length': '1000000'}
+        mock_response.iter_content.return_value = [b"fake mp3 content"]
+        mock_response.raise_for_status.return_value = None
+        mock_requests.Session.return_value.get.return_value = mock_response
+        
+        mock_mpeg_info.return_value = _FakeMPEGInfo(1800.0)
+        
+        handler = PodcastHandler(tmp_path, min_duration=60.0)
+        downloaded_files = handler.download_episodes("https://example.com/feed.xml")
+        
+        # The skipped trailer does not use up a number
+        assert [f.name for f in downloaded_files] == ["001_ep1.mp3"]
+        requested = [args[0] for args, _ in mock_requests.Session.return_value.get.call_args_list]
+        assert requested == ["https://example.com/ep1.mp3"]
+        # Not recorded as rejected: a corrected duration in the feed is picked up
+        assert "https://example.com/trailer.mp3" not in handler.rejected_urls
+    
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
+    @patch('tonuino_organizer.podcast_handler.feedparser')
+    @patch('tonuino_organizer.podcast_handler.requests')
+    def test_download_episodes_ignores_implausible_itunes_duration(
+        self, mock_requests, mock_feedparser, mock_mpeg_info, tmp_path
+    ):
+        """Test that a short itunes:duration is not trusted without a matching size."""
+        mock_feed = MagicMock()
+        # "45" meant as minutes: 43.2 MB is 45 minutes at 128 kbps
+        minutes_entry = MagicMock()
+        minutes_entry.get.side_effect = {'title': "Episode 2", 'itunes_duration': "45"}.get
+        minutes_entry.enclosures = [
+            {'type': 'audio/mpeg', 'href': 'https://example.com/ep2.mp3', 'length': '43200000'}
+        ]
+        # No size in the feed to check the duration against
+        unknown_entry = MagicMock()
+        unknown_entry.get.side_effect = {'title': "Episode 1", 'itunes_duration': "0:30"}.get
+        unknown_entry.enclosures = [{'type': 'audio/mpeg', 'href': 'https://example.com/ep1.mp3'}]
+        mock_feed.entries = [minutes_entry, unknown_entry]
+        mock_feed.bozo = False
+        mock_feedparser.parse.return_value = mock_feed
+        
+        def mock_get(url, **kwargs):
+            mock_response = MagicMock()
+            mock_response.headers = {'content-length': '43200000'}
+            mock_response.iter_content.return_value = [url.encode()]
+            mock_response.raise_for_status.return_value = None
+            return mock_response
+        
+        mock_requests.Session.return_value.get.side_effect = mock_get
+        mock_mpeg_info.return_value = _FakeMPEGInfo(2700.0)
+        
+        handler = PodcastHandler(tmp_path, min_duration=60.0)
+        downloaded_files = handler.download_episodes("https://example.com/feed.xml")
+        
+        assert [f.name for f in downloaded_files] == ["001_ep1.mp3", "002_ep2.mp3"]
+    
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
     @patch('tonuino_organizer.podcast_handler.feedparser')
     @patch('tonuino_organizer.podcast_handler.requests')
     def test_download_episodes_numbers_chronologically(
-        self, mock_requests, mock_feedparser, mock_mp3_class, tmp_path
+        self, mock_requests, mock_feedparser, mock_mpeg_info, tmp_path
     ):
         """Test that downloads are numbered chronologically."""
         # Set up feed with multiple entries (feedparser usually returns newest first)
@@ -352,23 +599,29 @@ class TestPodcastHandler:
         mock_feed.bozo = False
         mock_feedparser.parse.return_value = mock_feed
         
-        # Mock download response
-        mock_response = MagicMock()
-        mock_response.headers = {'content-length': '10000'}
-        mock_response.iter_content.return_value = [b"fake mp3 content"]
-        mock_response.raise_for_status.return_value = None
-        mock_requests.get.return_value = mock_response
+        # Mock download responses (different content per episode)
+        def mock_get(url, **kwargs):
+            mock_response = MagicMock()
+            mock_response.headers = {'content-length': '1000000'}
+            mock_response.iter_content.return_value = [url.encode()]
+            mock_response.raise_for_status.return_value = None
+            return mock_response
+        
+        mock_requests.Session.return_value.get.side_effect = mock_get
         
         # Mock MP3 duration - return valid duration
-        mock_audio = MagicMock()
-        mock_audio.info.length = 120.0  # Long enough
-        mock_mp3_class.return_value = mock_audio
+        mock_info = _FakeMPEGInfo(120.0)  # Long enough
+        mock_mpeg_info.return_value = mock_info
         
         handler = PodcastHandler(tmp_path, min_duration=60.0)
         downloaded_files = handler.download_episodes("https://example.com/feed.xml")
         
-        # Should download all three episodes
+        # Should download all three episodes over one shared session
         assert len(downloaded_files) == 3
+        assert mock_requests.Session.call_count == 1
+        assert mock_requests.Session.return_value.get.call_count == 3
+        
+        assert len((tmp_path / ".url_mapping").read_text().splitlines()) == 3
         
         # Check filenames have three-digit prefixes
         filenames = [f.name for f in downloaded_files]
@@ -376,11 +629,205 @@ class TestPodcastHandler:
         assert any("002_" in f for f in filenames)
         assert any("003_" in f for f in filenames)
     
-    @patch('tonuino_organizer.podcast_handler.MP3')
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
+    @patch('tonuino_organizer.podcast_handler.feedparser')
+    @patch('tonuino_organizer.podcast_handler.requests')
+    def test_download_episodes_records_each_episode_immediately(
+        self, mock_requests, mock_feedparser, mock_mpeg_info, tmp_path
+    ):
+        """Test that a finished episode is on disk in the tracking files right away."""
+        mock_feed = MagicMock()
+        entries = []
+        for i in (2, 1):
+            entry = MagicMock()
+            entry.get.return_value = f"Episode {i}"
+            entry.enclosures = [{'type': 'audio/mpeg', 'href': f'https://example.com/ep{i}.mp3'}]
+            entries.append(entry)
+        mock_feed.entries = entries
+        mock_feed.bozo = False
+        mock_feedparser.parse.return_value = mock_feed
+        
+        # Tracking files as seen when the second episode is requested
+        seen_before_second = {}
+        
+        def mock_get(url, **kwargs):
+            if url.endswith('ep2.mp3'):
+                for name in (".url_mapping", ".downloaded_files", ".content_hashes"):
+                    seen_before_second[name] = (tmp_path / name).read_text()
+            mock_response = MagicMock()
+            mock_response.headers = {'content-length': '1000000'}
+            mock_response.iter_content.return_value = [url.encode()]
+            mock_response.raise_for_status.return_value = None
+            return mock_response
+        
+        mock_requests.Session.return_value.get.side_effect = mock_get
+        mock_mpeg_info.return_value = _FakeMPEGInfo(120.0)
+        
+        handler = PodcastHandler(tmp_path, min_duration=60.0, download_workers=1)
+        handler.download_episodes("https://example.com/feed.xml")
+        
+        assert seen_before_second[".url_mapping"] == "https://example.com/ep1.mp3|1\n"
+        assert seen_before_second[".downloaded_files"] == "https://example.com/ep1.mp3\n"
+        assert seen_before_second[".content_hashes"].count("\n") == 1
+    
+    @pytest.mark.parametrize("download_workers", [1, 4])
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
+    @patch('tonuino_organizer.podcast_handler.feedparser')
+    @patch('tonuino_organizer.podcast_handler.requests')
+    def test_download_episodes_failure_does_not_affect_others(
+        self, mock_requests, mock_feedparser, mock_mpeg_info, tmp_path, download_workers
+    ):
+        """Test that one failed download keeps the other downloads and numbering."""
+        mock_feed = MagicMock()
+        entries = []
+        for name in ("ep3", "ep2", "ep1"):
+            entry = MagicMock()
+            entry.get.return_value = name
+            entry.enclosures = [{'type': 'audio/mpeg', 'href': f'https://example.com/{name}.mp3'}]
+            entries.append(entry)
+        mock_feed.entries = entries
+        mock_feed.bozo = False
+        mock_feedparser.parse.return_value = mock_feed
+        
+        def mock_get(url, **kwargs):
+            if url.endswith("ep2.mp3"):
+                raise Exception("Connection reset")
+            mock_response = MagicMock()
+            mock_response.headers = {'content-length': '1000000'}
+            mock_response.iter_content.return_value = [url.encode()]
+            mock_response.raise_for_status.return_value = None
+            return mock_response
+        
+        mock_requests.Session.return_value.get.side_effect = mock_get
+        
+        mock_info = _FakeMPEGInfo(120.0)
+        mock_mpeg_info.return_value = mock_info
+        
+        handler = PodcastHandler(tmp_path, min_duration=60.0, download_workers=download_workers)
+        downloaded_files = handler.download_episodes("https://example.com/feed.xml")
+        
+        assert [f.name for f in downloaded_files] == ["001_ep1.mp3", "003_ep3.mp3"]
+        assert not (tmp_path / "002_ep2.mp3").exists()
+        assert handler.downloaded_urls == {
+            "https://example.com/ep1.mp3",
+            "https://example.com/ep3.mp3",
+        }
+    
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
+    @patch('tonuino_organizer.podcast_handler.feedparser')
+    @patch('tonuino_organizer.podcast_handler.requests')
+    def test_download_episodes_ctrl_c_cancels_queued_downloads(
+        self, mock_requests, mock_feedparser, mock_mpeg_info, tmp_path
+    ):
+        """Test that an interrupt does not start the downloads still queued."""
+        mock_feed = MagicMock()
+        entries = []
+        for i in range(10, 0, -1):
+            entry = MagicMock()
+            entry.get.return_value = f"Episode {i}"
+            entry.enclosures = [{'type': 'audio/mpeg', 'href': f'https://example.com/ep{i:02d}.mp3'}]
+            entries.append(entry)
+        mock_feed.entries = entries
+        mock_feed.bozo = False
+        mock_feedparser.parse.return_value = mock_feed
+        
+        def mock_get(url, **kwargs):
+            if url.endswith("ep01.mp3"):
+                raise KeyboardInterrupt
+            # Slow enough that the queue cannot drain before the cancel
+            time.sleep(0.2)
+            mock_response = MagicMock()
+            mock_response.headers = {'content-length': '1000000'}
+            mock_response.iter_content.return_value = [url.encode()]
+            mock_response.raise_for_status.return_value = None
+            return mock_response
+        
+        mock_get_method = mock_requests.Session.return_value.get
+        mock_get_method.side_effect = mock_get
+        mock_mpeg_info.return_value = _FakeMPEGInfo(120.0)
+        
+        handler = PodcastHandler(tmp_path, min_duration=60.0, download_workers=1)
+        with pytest.raises(KeyboardInterrupt):
+            handler.download_episodes("https://example.com/feed.xml")
+        
+        # The single worker may already have started the next download
+        assert mock_get_method.call_count <= 2
+    
+    @patch('tonuino_organizer.podcast_handler.feedparser')
+    @patch('tonuino_organizer.podcast_handler.requests')
+    def test_download_episodes_interrupted_leaves_no_file(
+        self, mock_requests, mock_feedparser, tmp_path
+    ):
+        """Test that a download failing midway leaves neither episode nor partial file."""
+        mock_feed = MagicMock()
+        entry = MagicMock()
+        entry.get.return_value = "Episode 1"
+        entry.enclosures = [{'type': 'audio/mpeg', 'href': 'https://example.com/ep1.mp3'}]
+        mock_feed.entries = [entry]
+        mock_feed.bozo = False
+        mock_feedparser.parse.return_value = mock_feed
+        
+        def interrupted_content(chunk_size):
+            yield b"first chunk"
+            raise ConnectionError("Connection reset")
+        
+        mock_response = MagicMock()
+        mock_response.headers = {'content-length': '1000000'}
+        mock_response.iter_content.side_effect = interrupted_content
+        mock_response.raise_for_status.return_value = None
+        mock_requests.Session.return_value.get.return_value = mock_response
+        
+        handler = PodcastHandler(tmp_path, min_duration=60.0)
+        downloaded_files = handler.download_episodes("https://example.com/feed.xml")
+        
+        assert downloaded_files == []
+        assert list(tmp_path.glob("*ep1.mp3*")) == []
+        assert list(tmp_path.glob(".*ep1.mp3*")) == []
+        assert handler.downloaded_urls == set()
+    
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
+    @patch('tonuino_organizer.podcast_handler.feedparser')
+    @patch('tonuino_organizer.podcast_handler.requests')
+    def test_download_episodes_discards_duplicate_content(
+        self, mock_requests, mock_feedparser, mock_mpeg_info, tmp_path
+    ):
+        """Test that an episode re-announced under a new URL is not kept twice."""
+        existing = tmp_path / "001_ep1.mp3"
+        existing.write_bytes(b"same content")
+        digest = hashlib.sha256(b"same content").hexdigest()
+        (tmp_path / ".content_hashes").write_text(f"{digest}|001_ep1.mp3\n")
+        (tmp_path / ".url_mapping").write_text("https://old-cdn.example.com/ep1.mp3|1\n")
+        
+        mock_feed = MagicMock()
+        entry = MagicMock()
+        entry.get.return_value = "Episode 1"
+        entry.enclosures = [{'type': 'audio/mpeg', 'href': 'https://new-cdn.example.com/ep1.mp3'}]
+        mock_feed.entries = [entry]
+        mock_feed.bozo = False
+        mock_feedparser.parse.return_value = mock_feed
+        
+        mock_response = MagicMock()
+        mock_response.headers = {'content-length': '1000000'}
+        mock_response.iter_content.return_value = [b"same content"]
+        mock_response.raise_for_status.return_value = None
+        mock_requests.Session.return_value.get.return_value = mock_response
+        
+        mock_info = _FakeMPEGInfo(120.0)
+        mock_mpeg_info.return_value = mock_info
+        
+        handler = PodcastHandler(tmp_path, min_duration=60.0)
+        downloaded_files = handler.download_episodes("https://example.com/feed.xml")
+        
+        assert downloaded_files == []
+        assert [f.name for f in tmp_path.glob("*.mp3")] == ["001_ep1.mp3"]
+        assert handler.url_to_number["https://new-cdn.example.com/ep1.mp3"] == 1
+        assert "https://new-cdn.example.com/ep1.mp3" in handler.downloaded_urls
+    
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
     @patch('tonuino_organizer.podcast_handler.feedparser')
     @patch('tonuino_organizer.podcast_handler.requests')
     def test_download_episodes_skips_numbers_for_orphaned_files(
-        self, mock_requests, mock_feedparser, mock_mp3_class, tmp_path
+        self, mock_requests, mock_feedparser, mock_mpeg_info, tmp_path
     ):
         """Test that numbers are skipped for files not in feed."""
         # Create local file not in feed
@@ -399,15 +846,14 @@ class TestPodcastHandler:
         
         # Mock download response
         mock_response = MagicMock()
-        mock_response.headers = {'content-length': '10000'}
+        mock_response.headers = {'content-length': '1000000'}
         mock_response.iter_content.return_value = [b"fake mp3 content"]
         mock_response.raise_for_status.return_value = None
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
         
         # Mock MP3 duration
-        mock_audio = MagicMock()
-        mock_audio.info.length = 120.0
-        mock_mp3_class.return_value = mock_audio
+        mock_info = _FakeMPEGInfo(120.0)
+        mock_mpeg_info.return_value = mock_info
         
         handler = PodcastHandler(tmp_path, min_duration=60.0)
         downloaded_files = handler.download_episodes("https://example.com/feed.xml")
@@ -422,11 +868,11 @@ class TestPodcastHandler:
         # Orphaned file should still exist
         assert (tmp_path / "005_Orphaned_Episode.mp3").exists()
     
-    @patch('tonuino_organizer.podcast_handler.MP3')
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
     @patch('tonuino_organizer.podcast_handler.feedparser')
     @patch('tonuino_organizer.podcast_handler.requests')
     def test_download_episodes_continues_after_existing_files(
-        self, mock_requests, mock_feedparser, mock_mp3_class, tmp_path
+        self, mock_requests, mock_feedparser, mock_mpeg_info, tmp_path
     ):
         """Test that new downloads continue numbering after existing files."""
         # Create existing files with numbers
@@ -449,15 +895,14 @@ class TestPodcastHandler:
         
         # Mock download response
         mock_response = MagicMock()
-        mock_response.headers = {'content-length': '10000'}
+        mock_response.headers = {'content-length': '1000000'}
         mock_response.iter_content.return_value = [b"fake mp3 content"]
         mock_response.raise_for_status.return_value = None
-        mock_requests.get.return_value = mock_response
+        mock_requests.Session.return_value.get.return_value = mock_response
         
         # Mock MP3 duration
-        mock_audio = MagicMock()
-        mock_audio.info.length = 120.0
-        mock_mp3_class.return_value = mock_audio
+        mock_info = _FakeMPEGInfo(120.0)
+        mock_mpeg_info.return_value = mock_info
         
         handler = PodcastHandler(tmp_path, min_duration=60.0)
         downloaded_files = handler.download_episodes("https://example.com/feed.xml")
@@ -466,6 +911,167 @@ class TestPodcastHandler:
         assert len(downloaded_files) == 1
         assert downloaded_files[0].name.startswith("003_")
 
+    
+    @patch('tonuino_organizer.podcast_handler.feedparser')
+    @patch('tonuino_organizer.podcast_handler.requests')
+    def test_download_episodes_uses_cached_validators(
+        self, mock_requests, mock_feedparser, tmp_path
+    ):
+        """Test that ETag/Last-Modified are stored and sent on the next fetch."""
+        feed_url = "https://example.com/feed.xml"
+        mock_feedparser.parse.return_value = feedparser.FeedParserDict(
+            entries=[], bozo=False, etag='"abc"', modified="Mon, 01 Jan 2024 00:00:00 GMT"
+        )
+        
+        PodcastHandler(tmp_path).download_episodes(feed_url)
+        
+        mock_feedparser.parse.return_value = feedparser.FeedParserDict(
+            entries=[], bozo=False, status=304
+        )
+        downloaded_files = PodcastHandler(tmp_path).download_episodes(feed_url)
+        
+        assert downloaded_files == []
+        mock_feedparser.parse.assert_called_with(
+            feed_url, etag='"abc"', modified="Mon, 01 Jan 2024 00:00:00 GMT"
+        )
+        mock_requests.Session.return_value.get.assert_not_called()
+    
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
+    @patch('tonuino_organizer.podcast_handler.feedparser')
+    @patch('tonuino_organizer.podcast_handler.requests')
+    def test_download_episodes_retries_url_removed_from_rejected(
+        self, mock_requests, mock_feedparser, mock_mpeg_info, tmp_path
+    ):
+        """Test that editing .rejected_files bypasses the cached validators."""
+        feed_url = "https://example.com/feed.xml"
+        rejected_file = tmp_path / ".rejected_files"
+        rejected_file.write_text("https://example.com/ep1.mp3\n")
+        mock_entry = MagicMock()
+        mock_entry.get.return_value = "Episode"
+        mock_entry.enclosures = [{'type': 'audio/mpeg', 'href': 'https://example.com/ep1.mp3'}]
+        mock_feedparser.parse.return_value = feedparser.FeedParserDict(
+            entries=[mock_entry], bozo=False, etag='"abc"'
+        )
+        mock_response = MagicMock()
+        mock_response.headers = {'content-length': '1000000'}
+        mock_response.iter_content.return_value = [b"episode content"]
+        mock_requests.Session.return_value.get.return_value = mock_response
+        mock_mpeg_info.return_value = _FakeMPEGInfo(120.0)
+        
+        with PodcastHandler(tmp_path, min_duration=60.0) as handler:
+            assert handler.download_episodes(feed_url) == []
+        
+        # The user removes the URL to give the episode another try
+        rejected_file.write_text("")
+        with PodcastHandler(tmp_path, min_duration=60.0) as handler:
+            downloaded_files = handler.download_episodes(feed_url)
+        
+        mock_feedparser.parse.assert_called_with(feed_url, etag=None, modified=None)
+        assert [f.name for f in downloaded_files] == ["001_ep1.mp3"]
+        
+        # Unchanged local state uses the validators again
+        with PodcastHandler(tmp_path, min_duration=60.0) as handler:
+            handler.download_episodes(feed_url)
+        mock_feedparser.parse.assert_called_with(feed_url, etag='"abc"', modified=None)
+    
+    @patch('tonuino_organizer.podcast_handler.feedparser')
+    @patch('tonuino_organizer.podcast_handler.requests')
+    def test_download_episodes_clears_validators_on_error(
+        self, mock_requests, mock_feedparser, tmp_path
+    ):
+        """Test that a failed download prevents caching the feed validators."""
+        feed_url = "https://example.com/feed.xml"
+        (tmp_path / ".feed_cache").write_text(
+            '{"feed_url": "https://example.com/feed.xml", "etag": "old"}'
+        )
+        mock_entry = MagicMock()
+        mock_entry.get.return_value = "Episode"
+        mock_entry.enclosures = [{'type': 'audio/mpeg', 'href': 'https://example.com/ep1.mp3'}]
+        mock_feedparser.parse.return_value = feedparser.FeedParserDict(
+            entries=[mock_entry], bozo=False, etag='"new"'
+        )
+        mock_requests.Session.return_value.get.side_effect = Exception("Connection reset")
+        
+        handler = PodcastHandler(tmp_path)
+        handler.download_episodes(feed_url)
+        
+        assert handler._load_feed_cache(feed_url) == {}
+
+
+class TestExtractAudioUrl:
+    """Tests for _extract_audio_url function."""
+    
+    def test_prefers_audio_enclosure(self):
+        """Test that the first audio enclosure is used."""
+        entry = SimpleNamespace(
+            enclosures=[
+                {'type': 'image/jpeg', 'href': 'https://example.com/cover.jpg'},
+                {'type': 'audio/mpeg', 'href': 'https://example.com/ep1.mp3'},
+            ],
+            links=[{'type': 'audio/mpeg', 'href': 'https://example.com/other.mp3'}],
+        )
+        assert _extract_audio_url(entry) == "https://example.com/ep1.mp3"
+    
+    def test_falls_back_to_audio_link(self):
+        """Test that audio links are used if no enclosure has a URL."""
+        entry = SimpleNamespace(
+            enclosures=[{'type': 'audio/mpeg'}],
+            links=[
+                {'type': 'text/html', 'href': 'https://example.com/ep1'},
+                {'type': 'audio/mpeg', 'href': 'https://example.com/ep1.mp3'},
+            ],
+        )
+        assert _extract_audio_url(entry) == "https://example.com/ep1.mp3"
+    
+    def test_no_audio(self):
+        """Test that entries without audio give None."""
+        assert _extract_audio_url(SimpleNamespace()) is None
+        entry = SimpleNamespace(links=[{'type': 'text/html', 'href': 'https://example.com/'}])
+        assert _extract_audio_url(entry) is None
+
+
+class TestExtractAudioLength:
+    """Tests for _extract_audio_length function."""
+    
+    def test_length_of_matching_enclosure(self):
+        """Test that the length of the item with the audio URL is used."""
+        entry = SimpleNamespace(enclosures=[
+            {'type': 'image/jpeg', 'href': 'https://example.com/cover.jpg', 'length': '5000'},
+            {'type': 'audio/mpeg', 'href': 'https://example.com/ep1.mp3', 'length': '720000'},
+        ])
+        assert _extract_audio_length(entry, "https://example.com/ep1.mp3") == 720000
+    
+    def test_missing_or_invalid_length(self):
+        """Test that missing, zero and unparseable lengths give None."""
+        for length in (None, '', '0', 'unknown'):
+            entry = SimpleNamespace(
+                enclosures=[{'type': 'audio/mpeg', 'href': 'https://example.com/ep1.mp3', 'length': length}]
+            )
+            assert _extract_audio_length(entry, "https://example.com/ep1.mp3") is None
+        assert _extract_audio_length(SimpleNamespace(), "https://example.com/ep1.mp3") is None
+
+
+class TestParseItunesDuration:
+    """Tests for _parse_itunes_duration function."""
+    
+    def test_seconds(self):
+        """Test durations given in seconds."""
+        assert _parse_itunes_duration("1800") == 1800.0
+        assert _parse_itunes_duration("95.5") == 95.5
+    
+    def test_clock_time(self):
+        """Test durations given as MM:SS and HH:MM:SS."""
+        assert _parse_itunes_duration("30:00") == 1800.0
+        assert _parse_itunes_duration("1:02:03") == 3723.0
+    
+    def test_unusable_values(self):
+        """Test that missing, invalid or zero durations are ignored."""
+        assert _parse_itunes_duration(None) is None
+        assert _parse_itunes_duration("") is None
+        assert _parse_itunes_duration("about an hour") is None
+        assert _parse_itunes_duration("1:2:3:4") is None
+        assert _parse_itunes_duration("00:00") is None
+
 
 class TestProcessPodcast:
     """Tests for process_podcast function."""
@@ -483,6 +1089,20 @@ class TestProcessPodcast:
         
         assert len(mp3_files) == 2
     
+    @patch('tonuino_organizer.podcast_handler.MPEGInfo')
+    def test_process_podcast_no_update_skips_duration_check(self, mock_mpeg_info, tmp_path):
+        """Test that durations are not checked without update."""
+        (tmp_path / "episode1.mp3").touch()
+        
+        mp3_files = process_podcast(
+            tmp_path,
+            "https://example.com/feed.xml",
+            update=False
+        )
+        
+        assert mp3_files == [tmp_path / "episode1.mp3"]
+        mock_mpeg_info.assert_not_called()
+    
     @patch('tonuino_organizer.podcast_handler.feedparser')
     def test_process_podcast_with_update(self, mock_feedparser, tmp_path):
         """Test processing podcast with update."""
@@ -1,5 +1,6 @@
 """Tests for utils module."""
 
+import os
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -11,6 +12,7 @@ from tonuino_organizer.utils import (
     sort_files_naturally,
     find_mp3_files,
     extract_two_digit_prefix,
+    has_two_digit_prefix,
     format_file_size,
 )
 
@@ -58,6 +60,12 @@ class TestIsMp3File:
         file_path.touch()
         assert is_mp3_file(file_path) is False
     
+    def test_bare_extension_returns_false(self, tmp_path):
+        """Test that a dotfile named .mp3 has no MP3 extension."""
+        file_path = tmp_path / ".mp3"
+        file_path.touch()
+        assert is_mp3_file(file_path) is False
+    
     def test_directory_returns_false(self, tmp_path):
         """Test that directories return False."""
         dir_path = tmp_path / "test_dir"
@@ -106,6 +114,20 @@ class TestSortFilesNaturally:
         assert sorted_files[0].name == "file1.mp3"
         assert sorted_files[1].name == "file2.mp3"
         assert sorted_files[2].name == "file10.mp3"
+    
+    def test_same_names_ordered_by_path(self, tmp_path):
+        """Test that equal names in different folders get a stable order."""
+        files = [
+            tmp_path / "CD2" / "01.mp3",
+            tmp_path / "CD1" / "02.mp3",
+            tmp_path / "CD1" / "01.mp3",
+        ]
+        sorted_files = sort_files_naturally(files)
+        assert sorted_files == [
+            tmp_path / "CD1" / "01.mp3",
+            tmp_path / "CD2" / "01.mp3",
+            tmp_path / "CD1" / "02.mp3",
+        ]
 
 
 class TestFindMp3Files:
@@ -138,6 +160,57 @@ class TestFindMp3Files:
         assert len(mp3_files) == 1
         assert mp3_files[0].name == "file1.mp3"
     
+    def test_finds_uppercase_extension(self, tmp_path):
+        """Test that MP3 extension matching is case-insensitive."""
+        (tmp_path / "file1.MP3").touch()
+        (tmp_path / "file2.mp3").touch()
+        
+        mp3_files = find_mp3_files(tmp_path, recursive=True)
+        assert [f.name for f in mp3_files] == ["file1.MP3", "file2.mp3"]
+    
+    def test_reuses_scan_of_unchanged_directory(self, tmp_path):
+        """Test that an unchanged directory tree is not listed again."""
+        find_mp3_files.cache_clear()
+        subdir = tmp_path / "subdir"
+        subdir.mkdir()
+        (subdir / "file1.mp3").touch()
+        for directory in (tmp_path, subdir):
+            os.utime(directory, ns=(0, 0))
+        
+        first = find_mp3_files(tmp_path, recursive=True)
+        with patch('tonuino_organizer.utils.os.scandir', side_effect=AssertionError):
+            assert find_mp3_files(tmp_path, recursive=True) == first
+        
+        # Adding a file updates the directory's mtime and invalidates the scan
+        (subdir / "file2.mp3").touch()
+        mp3_files = find_mp3_files(tmp_path, recursive=True)
+        assert [f.name for f in mp3_files] == ["file1.mp3", "file2.mp3"]
+    
+    def test_skips_unreadable_subdirectory(self, tmp_path):
+        """Test that an unreadable subdirectory is skipped instead of failing."""
+        find_mp3_files.cache_clear()
+        (tmp_path / "1.mp3").touch()
+        locked = tmp_path / "locked"
+        locked.mkdir()
+        (locked / "2.mp3").touch()
+        for directory in (tmp_path, locked):
+            os.utime(directory, ns=(0, 0))
+        
+        real_scandir = os.scandir
+        
+        def scandir(path):
+            if path == os.fspath(locked):
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+        
+        with patch('tonuino_organizer.utils.os.scandir', side_effect=scandir):
+            mp3_files = find_mp3_files(tmp_path, recursive=True)
+        assert [f.name for f in mp3_files] == ["1.mp3"]
+        
+        # Once readable again, the subdirectory is listed despite the cache
+        mp3_files = find_mp3_files(tmp_path, recursive=True)
+        assert [f.name for f in mp3_files] == ["1.mp3", "2.mp3"]
+    
     def test_nonexistent_directory(self):
         """Test that nonexistent directory returns empty list."""
         mp3_files = find_mp3_files(Path("/nonexistent/path"), recursive=True)
@@ -192,6 +265,23 @@ class TestExtractTwoDigitPrefix:
             extract_two_digit_prefix("")
 
 
+class TestHasTwoDigitPrefix:
+    """Tests for has_two_digit_prefix function."""
+    
+    def test_valid_prefix(self):
+        """Test that valid prefixes are recognized."""
+        assert has_two_digit_prefix("01_Album") is True
+        assert has_two_digit_prefix("99_") is True
+    
+    def test_invalid_prefix(self):
+        """Test that invalid prefixes are rejected without raising."""
+        assert has_two_digit_prefix("Album") is False
+        assert has_two_digit_prefix("1_Album") is False
+        assert has_two_digit_prefix("001_Album") is False
+        assert has_two_digit_prefix("01Album") is False
+        assert has_two_digit_prefix("") is False
+
+
 class TestFormatFileSize:
     """Tests for format_file_size function."""
     
@@ -218,3 +308,15 @@ class TestFormatFileSize:
         result = format_file_size(int(size_gb))
         assert "GB" in result
 
+    
+    def test_unit_boundaries(self):
+        """Test that each unit starts at exactly 1024 of the previous one."""
+        assert format_file_size(1023) == "1023.0 B"
+        assert format_file_size(1024) == "1.0 KB"
+        assert format_file_size(1024 ** 2 - 1) == "1024.0 KB"
+        assert format_file_size(1024 ** 2) == "1.0 MB"
+    
+    def test_terabytes(self):
+        """Test that sizes beyond gigabytes are shown in TB."""
+        assert format_file_size(1024 ** 4) == "1.0 TB"
+        assert format_file_size(1024 ** 5) == "1024.0 TB"
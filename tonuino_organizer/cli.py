@@ -1,5 +1,6 @@
 """Command-line interface for tonuino organizer."""
 
+import os
 from pathlib import Path
 
 import click
@@ -8,11 +9,11 @@ from rich.panel import Panel
 from rich.table import Table
 
 from .config import Config
-from .description import DescriptionError, get_description_type, get_feed_url, get_min_duration
+from .description import DescriptionError, DEFAULT_MIN_DURATION, load_description
 from .album_handler import process_static_album
 from .podcast_handler import process_podcast
 from .file_organizer import organize_files
-from .utils import extract_two_digit_prefix
+from .utils import extract_two_digit_prefix, has_two_digit_prefix
 
 console = Console()
 
@@ -31,15 +32,13 @@ def find_album_folders(input_path: Path):
         console.print(f"[red]Input directory does not exist: {input_path}[/red]")
         return
     
-    for item in input_path.iterdir():
-        if item.is_dir():
-            try:
-                # Validate two-digit prefix
-                extract_two_digit_prefix(item.name)
-                yield item
-            except ValueError:
-                # Skip folders without valid prefix
-                continue
+    # DirEntry.is_dir() uses the file type from the directory listing, so
+    # only symlinks need an extra stat()
+    with os.scandir(input_path) as it:
+        for entry in it:
+            # Skip entries without valid two-digit prefix
+            if has_two_digit_prefix(entry.name) and entry.is_dir():
+                yield Path(entry.path)
 
 
 @click.command()
@@ -106,14 +105,16 @@ def main(input: str, output: str, update: bool):
             # Extract prefix for display
             prefix = extract_two_digit_prefix(folder_name)
             
-            # Read description file
+            # Read description file (parsed once, all fields are taken from it)
             try:
-                description_type = get_description_type(folder_path)
+                description = load_description(folder_path)
             except DescriptionError as e:
                 console.print(f"\n[red]Error reading description for {folder_name}: {e}[/red]")
                 stats['errors'] += 1
                 continue
             
+            description_type = description['type']
+            
             console.print(f"\n{'='*60}")
             console.print(f"[bold]Folder:[/bold] {folder_name} (Type: {description_type})")
             console.print(f"{'='*60}")
@@ -122,8 +123,8 @@ def main(input: str, output: str, update: bool):
             if description_type == 'static':
                 mp3_files = process_static_album(folder_path)
             elif description_type == 'rss':
-                feed_url = get_feed_url(folder_path)
-                min_duration = get_min_duration(folder_path)
+                feed_url = description['feed_url']
+                min_duration = description.get('min_duration', DEFAULT_MIN_DURATION)
                 mp3_files = process_podcast(folder_path, feed_url, update=update, min_duration=min_duration)
             else:
                 console.print(f"[red]Unknown type: {description_type}[/red]")
@@ -26,9 +26,18 @@ class Config:
         """
         self.input_path = expand_path(input_path or self.DEFAULT_INPUT_PATH)
         self.output_path = expand_path(output_path or self.DEFAULT_OUTPUT_PATH)
+        self._directories_ensured = False
     
     def ensure_directories(self):
-        """Create input and output directories if they don't exist."""
+        """
+        Create input and output directories if they don't exist.
+        
+        Only the first call touches the filesystem; later calls on the same
+        Config are no-ops.
+        """
+        if self._directories_ensured:
+            return
         self.input_path.mkdir(parents=True, exist_ok=True)
         self.output_path.mkdir(parents=True, exist_ok=True)
+        self._directories_ensured = True
 
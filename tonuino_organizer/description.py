@@ -5,38 +5,30 @@ from typing import Dict, Optional
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Minimum episode duration in seconds if description.yaml sets none
+DEFAULT_MIN_DURATION = 60.0
+
 
 class DescriptionError(Exception):
     """Error reading or parsing description file."""
     pass
 
 
-def load_description(folder_path: Path) -> Dict:
+def validate_description(data) -> None:
     """
-    Load and parse description.yaml file from a folder.
+    Validate parsed description data.
+    
+    Checks type first, then feed_url (RSS only), then min_duration.
     
     Args:
-        folder_path: Path to the folder containing description.yaml
-        
-    Returns:
-        Dictionary with description data (type, feed_url if applicable)
+        data: Parsed content of description.yaml
         
     Raises:
-        DescriptionError: If description file is missing or invalid
+        DescriptionError: If the data does not describe a valid album/podcast
     """
-    description_file = folder_path / "description.yaml"
-    
-    if not description_file.exists():
-        raise DescriptionError(f"Description file not found: {description_file}")
-    
-    try:
-        with open(description_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        raise DescriptionError(f"Invalid YAML in description file: {e}")
-    except Exception as e:
-        raise DescriptionError(f"Error reading description file: {e}")
-    
     if not isinstance(data, dict):
         raise DescriptionError("Description file must contain a YAML dictionary")
     
@@ -58,10 +50,41 @@ def load_description(folder_path: Path) -> Dict:
     # Validate min_duration if present (optional, must be positive number)
     if 'min_duration' in data:
         min_duration = data['min_duration']
-        if not isinstance(min_duration, (int, float)):
+        # bool is an int subclass, but `min_duration: yes` is not a duration
+        if isinstance(min_duration, bool) or not isinstance(min_duration, (int, float)):
             raise DescriptionError("'min_duration' must be a number")
         if min_duration <= 0:
             raise DescriptionError("'min_duration' must be a positive number")
+
+
+def load_description(folder_path: Path) -> Dict:
+    """
+    Load and parse description.yaml file from a folder.
+    
+    Args:
+        folder_path: Path to the folder containing description.yaml
+        
+    Returns:
+        Dictionary with description data (type, feed_url if applicable,
+        min_duration if set)
+        
+    Raises:
+        DescriptionError: If description file is missing or invalid
+    """
+    description_file = folder_path / "description.yaml"
+    
+    if not description_file.exists():
+        raise DescriptionError(f"Description file not found: {description_file}")
+    
+    try:
+        with open(description_file, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=YamlLoader)
+    except yaml.YAMLError as e:
+        raise DescriptionError(f"Invalid YAML in description file: {e}")
+    except Exception as e:
+        raise DescriptionError(f"Error reading description file: {e}")
+    
+    validate_description(data)
     
     return data
 
@@ -94,7 +117,7 @@ def get_feed_url(folder_path: Path) -> Optional[str]:
     return data.get('feed_url')
 
 
-def get_min_duration(folder_path: Path, default: float = 60.0) -> float:
+def get_min_duration(folder_path: Path, default: float = DEFAULT_MIN_DURATION) -> float:
     """
     Get the minimum duration in seconds from a description file.
     
@@ -1,7 +1,11 @@
 """File organization logic: renaming and copying MP3 files."""
 
+import errno
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Union
 
 import shutil
 from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
@@ -11,21 +15,105 @@ from .utils import extract_two_digit_prefix, format_file_size
 
 console = Console()
 
+StrPath = Union[str, os.PathLike]
+
+# os.copy_file_range is only available on Linux (Python 3.8+)
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+
+
+def _copy_file_range(source_file: StrPath, dest_file: StrPath):
+    """
+    Copy file contents with os.copy_file_range, keeping data in kernel space.
+    
+    Args:
+        source_file: File to copy from
+        dest_file: File to copy to (created or truncated)
+        
+    Raises:
+        OSError: If the kernel or filesystem does not support the copy, or
+            the copy stops before all data is written
+    """
+    src_fd = os.open(source_file, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        remaining = os.fstat(src_fd).st_size
+        dst_fd = os.open(
+            dest_file,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC,
+            0o666
+        )
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    # Some filesystems report success without copying
+                    raise OSError(errno.EIO, "copy_file_range stopped early", source_file)
+                remaining -= copied
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+def copy_file(source_file: StrPath, dest_file: StrPath):
+    """
+    Copy a file including its metadata (like shutil.copy2).
+    
+    Uses os.copy_file_range where available and falls back to
+    shutil.copyfile (which uses sendfile on Linux) otherwise.
+    
+    Args:
+        source_file: File to copy from
+        dest_file: File to copy to
+        
+    Raises:
+        shutil.SameFileError: If source_file and dest_file are the same file
+    """
+    # dest_file is truncated before copying, so copying a file onto itself
+    # would empty it (shutil.copyfile has the same check)
+    try:
+        same_file = os.path.samefile(source_file, dest_file)
+    except OSError:
+        same_file = False
+    if same_file:
+        raise shutil.SameFileError(f"{source_file!r} and {dest_file!r} are the same file")
+    
+    if _HAS_COPY_FILE_RANGE:
+        try:
+            _copy_file_range(source_file, dest_file)
+        except OSError:
+            # e.g. EXDEV on older kernels, unsupported filesystems or a
+            # short copy; shutil.copyfile truncates and starts over
+            shutil.copyfile(source_file, dest_file)
+    else:
+        shutil.copyfile(source_file, dest_file)
+    shutil.copystat(source_file, dest_file)
+
 
 def organize_files(
     mp3_files: List[Path],
     folder_name: str,
     output_path: Path,
-    overwrite: bool = True
+    overwrite: bool = True,
+    max_workers: int = 1
 ) -> List[Path]:
     """
     Organize MP3 files into output directory with standardized naming.
     
+    Files are copied by a thread pool; the numbering always follows the
+    order of mp3_files. Copied files are listed in that order once the
+    progress bar is done.
+    
+    The output is usually a FAT-formatted SD card, where TonUINO's DFPlayer
+    plays files in directory entry order and parallel copies would create
+    the entries (and allocate clusters) in no particular order. Files are
+    therefore copied one at a time unless max_workers is raised.
+    
     Args:
         mp3_files: List of MP3 file paths to organize (should be sorted)
         folder_name: Name of the source folder (used to extract prefix)
         output_path: Base output directory path
         overwrite: If True, overwrite existing files
+        max_workers: Number of copy threads (default: 1, see above)
         
     Returns:
         List of Path objects for the copied files
@@ -33,6 +121,7 @@ def organize_files(
     Raises:
         ValueError: If folder name doesn't have a valid two-digit prefix
         ValueError: If there are more than 255 files
+        OSError: If copying a file fails; copies not yet started are cancelled
     """
     if len(mp3_files) > 255:
         raise ValueError(f"Too many MP3 files ({len(mp3_files)}). Maximum is 255.")
@@ -44,53 +133,76 @@ def organize_files(
     output_folder = output_path / prefix
     output_folder.mkdir(parents=True, exist_ok=True)
     
-    copied_files = []
+    # Generate new filenames (001.mp3, 002.mp3, ..., 255.mp3); the copy loop
+    # works on plain strings, Path objects are only built for the result
+    output_folder_str = os.fspath(output_folder)
+    copy_jobs = [
+        (index, os.fspath(source_file), source_file.name, f"{index + 1:03d}.mp3")
+        for index, source_file in enumerate(mp3_files)
+    ]
+    # Success lines per job, printed after the progress bar instead of
+    # rendering a line per file while it is live
+    copied_lines: List[Optional[str]] = [None] * len(copy_jobs)
     
     # Use rich progress bar for file operations
-    with Progress(
-        TextColumn("[bold blue]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TextColumn("•"),
-        TimeRemainingColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task(
-            f"Organizing {len(mp3_files)} files from {folder_name}",
-            total=len(mp3_files)
-        )
-        
-        for index, source_file in enumerate(mp3_files, start=1):
-            # Generate new filename (001.mp3, 002.mp3, ..., 255.mp3)
-            new_filename = f"{index:03d}.mp3"
-            dest_file = output_folder / new_filename
-            
-            # Update progress description with current file
-            progress.update(
-                task,
-                description=f"Copying {source_file.name} → {new_filename}",
-                advance=0
+    try:
+        with Progress(
+            TextColumn("[bold blue]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TextColumn("•"),
+            TimeRemainingColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task(
+                f"Organizing {len(mp3_files)} files from {folder_name}",
+                total=len(mp3_files)
             )
             
-            # Copy file
-            try:
-                shutil.copy2(source_file, dest_file)
-                copied_files.append(dest_file)
+            # Set by the first failed copy; jobs starting later do nothing
+            copy_failed = threading.Event()
+            
+            def copy_one(job):
+                if copy_failed.is_set():
+                    return None
+                index, source_file, source_name, new_filename = job
+                dest_file = os.path.join(output_folder_str, new_filename)
+                try:
+                    copy_file(source_file, dest_file)
+                    
+                    # Show file size info
+                    file_size = os.stat(source_file).st_size
+                    copied_lines[index] = (
+                        f"  [green]✓[/green] {source_name} → {new_filename} "
+                        f"({format_file_size(file_size)})"
+                    )
+                except Exception as e:
+                    console.print(
+                        f"  [red]✗[/red] Error copying {source_name}: {e}",
+                        style="red"
+                    )
+                    copy_failed.set()
+                    raise
                 
-                # Show file size info
-                file_size = source_file.stat().st_size
-                console.print(
-                    f"  [green]✓[/green] {source_file.name} → {new_filename} "
-                    f"({format_file_size(file_size)})"
-                )
-            except Exception as e:
-                console.print(
-                    f"  [red]✗[/red] Error copying {source_file.name}: {e}",
-                    style="red"
-                )
-                raise
+                progress.advance(task)
+                return dest_file
             
-            progress.advance(task)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(copy_one, job) for job in copy_jobs]
+                try:
+                    # Jobs start in submission order, so a failed job comes
+                    # before every job skipped because of it
+                    copied_files = [Path(future.result()) for future in futures]
+                except BaseException:
+                    # Only the copies already running finish (cancelled one
+                    # by one; shutdown(cancel_futures=True) needs Python 3.9)
+                    for future in futures:
+                        future.cancel()
+                    raise
+    finally:
+        # Also list what was copied before an error stopped the run
+        for line in copied_lines:
+            if line is not None:
+                console.print(line)
     
     return copied_files
-
@@ -1,46 +1,297 @@
 """Handler for RSS feed podcast processing and downloading."""
 
 import hashlib
+import json
+import os
 import re
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set, Dict, Optional
+from typing import List, Set, Dict, Optional, TextIO
 from urllib.parse import urlparse
 
 import feedparser
 import requests
-from mutagen.mp3 import MP3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from mutagen.mp3 import MPEGInfo
 from mutagen import MutagenError
 from rich.console import Console
 from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, DownloadColumn, TransferSpeedColumn
 
 from .utils import find_mp3_files, format_file_size
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
+# JSON (de)serialization for internal cache files; orjson is optional
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
 # Default minimum duration in seconds (10 minutes)
 DEFAULT_MIN_DURATION_SECONDS = 600
 
+# (connect, read) timeouts in seconds for episode downloads
+DOWNLOAD_TIMEOUT = (5, 30)
+
+# Read/write size for episode downloads (1 MiB)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Lowest bitrate an MP3 stream can have (MPEG-2.5 Layer III), in bits per
+# second; no episode can play longer than its size at this bitrate
+MIN_MP3_BITRATE = 8000
+
+# Highest bitrate of a (non free-format) MP3 stream, in bits per second, and
+# room for ID3 tags such as cover art; an episode of a given duration cannot
+# be larger than that
+MAX_MP3_BITRATE = 320000
+MAX_ID3_TAG_SIZE = 2 << 20
+
+# Deferred tracking-file lines are written out at the latest after this many
+TRACKING_FLUSH_INTERVAL = 32
+
+# Number of episodes downloaded in parallel
+DEFAULT_DOWNLOAD_WORKERS = 4
+
+# Number of threads reading MP3 durations in get_local_files
+DEFAULT_SCAN_WORKERS = 8
+
+# Three-digit episode number at the start of a filename (e.g. "001_")
+_NUMBER_PREFIX_RE = re.compile(r'^(\d{3})_')
+
+# Characters not allowed in a title-based filename. \w keeps exactly what
+# str.isalnum() keeps (including non-ASCII letters) plus the underscore
+_UNSAFE_TITLE_RE = re.compile(r'[^\w -]')
+
+
+def _extract_audio_url(entry) -> Optional[str]:
+    """
+    Get the audio URL of a feed entry.
+    
+    Uses the first audio enclosure; entries without one fall back to the
+    first audio link.
+    
+    Args:
+        entry: feedparser entry
+        
+    Returns:
+        URL of the episode audio, or None if the entry has none
+    """
+    for attribute in ('enclosures', 'links'):
+        for item in getattr(entry, attribute, ()):
+            if (item.get('type') or '').startswith('audio/'):
+                href = item.get('href')
+                if href:
+                    return href
+                break
+    return None
+
+
+def _extract_audio_length(entry, url: str) -> Optional[int]:
+    """
+    Get the size the feed states for an episode's audio (enclosure length).
+    
+    Args:
+        entry: feedparser entry
+        url: Audio URL of the entry (see _extract_audio_url)
+        
+    Returns:
+        Size in bytes, or None if missing, unparseable or not positive
+    """
+    for attribute in ('enclosures', 'links'):
+        for item in getattr(entry, attribute, ()):
+            if item.get('href') == url:
+                try:
+                    length = int(item.get('length') or 0)
+                except (TypeError, ValueError):
+                    return None
+                return length if length > 0 else None
+    return None
+
+
+def _parse_itunes_duration(value) -> Optional[float]:
+    """
+    Parse an itunes:duration value from a feed entry.
+    
+    Args:
+        value: Seconds ("1800", "1800.5") or clock time ("30:00", "0:30:00")
+        
+    Returns:
+        Duration in seconds, or None if missing, unparseable or not positive
+    """
+    if not isinstance(value, str):
+        return None
+    
+    parts = value.strip().split(':')
+    if len(parts) > 3:
+        return None
+    
+    seconds = 0.0
+    try:
+        for part in parts:
+            seconds = seconds * 60 + float(part)
+    except ValueError:
+        return None
+    
+    return seconds if seconds > 0 else None
+
 
 class PodcastHandler:
     """Handler for RSS feed podcasts."""
     
-    def __init__(self, folder_path: Path, min_duration: float = DEFAULT_MIN_DURATION_SECONDS):
+    def __init__(
+        self,
+        folder_path: Path,
+        min_duration: float = DEFAULT_MIN_DURATION_SECONDS,
+        download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        scan_workers: int = DEFAULT_SCAN_WORKERS
+    ):
         """
         Initialize podcast handler.
         
         Args:
             folder_path: Path to the podcast folder
             min_duration: Minimum duration in seconds for keeping files (default: 60.0)
+            download_workers: Number of episodes downloaded in parallel (default: 4)
+            scan_workers: Number of threads reading durations of local files (default: 8)
         """
         self.folder_path = folder_path
         self.min_duration = min_duration
+        self.download_workers = download_workers
+        self.scan_workers = scan_workers
+        # Guards tracking sets/files while downloads run in worker threads
+        self._state_lock = threading.Lock()
         self.downloaded_files_file = folder_path / ".downloaded_files"
         self.rejected_files_file = folder_path / ".rejected_files"
         self.url_mapping_file = folder_path / ".url_mapping"
+        self.feed_cache_file = folder_path / ".feed_cache"
+        self.duration_cache_file = folder_path / ".duration_cache"
+        self.content_hashes_file = folder_path / ".content_hashes"
+        # Append handles for the tracking files, opened on first write
+        self._tracking_handles: Dict[Path, TextIO] = {}
+        # Lines held back while tracking writes are deferred (see flush())
+        self._pending_lines: Dict[Path, List[str]] = {}
+        self._pending_line_count = 0
+        self._defer_tracking_writes = False
         self.downloaded_urls: Set[str] = self._load_downloaded_urls()
         self.rejected_urls: Set[str] = self._load_rejected_urls()
         self.url_to_number: Dict[str, int] = self._load_url_mapping()
+        # Inverse of url_to_number (a reused number maps to its latest URL)
+        self.number_to_url: Dict[int, str] = {
+            number: url for url, number in self.url_to_number.items()
+        }
         self.local_files_by_number: Dict[int, Path] = self._scan_local_files()
+        self.content_hashes: Dict[str, Path] = self._load_content_hashes()
+        self._duration_cache: Dict[str, List] = self._load_duration_cache()
+        self._duration_cache_dirty = False
+        # HTTP session for episode downloads, created on first use
+        self._session: Optional[requests.Session] = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Save pending state, close the HTTP session and tracking file handles."""
+        self.flush()
+        self._save_duration_cache()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        for handle in self._tracking_handles.values():
+            try:
+                # Make the run's tracking lines durable once, instead of per line
+                handle.flush()
+                os.fsync(handle.fileno())
+                handle.close()
+            except Exception as e:
+                console.print(f"[yellow]Warning: Could not close {handle.name}: {e}[/yellow]")
+        self._tracking_handles.clear()
+    
+    def _get_session(self) -> requests.Session:
+        """
+        Get the HTTP session used for downloads.
+        
+        The session keeps connections alive between episodes (most feeds host
+        all episodes on the same CDN) and retries transient server errors.
+        Download threads share one session; it is created under the state
+        lock so concurrent first calls cannot each build their own.
+        
+        Returns:
+            requests.Session instance
+        """
+        if self._session is None:
+            with self._state_lock:
+                # Checked again: another thread may have created it meanwhile
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=4,
+                        pool_maxsize=16,
+                        max_retries=Retry(
+                            total=3,
+                            backoff_factor=0.3,
+                            status_forcelist=(500, 502, 503, 504)
+                        )
+                    )
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session = session
+        return self._session
+    
+    def _get_tracking_handle(self, file_path: Path) -> TextIO:
+        """Get the (line-buffered) append handle for a tracking file."""
+        handle = self._tracking_handles.get(file_path)
+        if handle is None:
+            handle = open(file_path, 'a', encoding='utf-8', buffering=1)
+            self._tracking_handles[file_path] = handle
+        return handle
+    
+    def _append_line(self, file_path: Path, line: str):
+        """
+        Append a line to a tracking file, keeping the file open for later writes.
+        
+        The handle is line-buffered, so every line reaches the file immediately,
+        unless writes are deferred (during download_episodes); then the line
+        is held in memory until flush().
+        
+        Args:
+            file_path: Tracking file to append to
+            line: Line to append (without newline)
+        """
+        if self._defer_tracking_writes:
+            self._pending_lines.setdefault(file_path, []).append(line)
+            self._pending_line_count += 1
+            # Bound what a hard crash (e.g. SIGKILL) can lose during long runs
+            if self._pending_line_count >= TRACKING_FLUSH_INTERVAL:
+                self.flush()
+            return
+        self._get_tracking_handle(file_path).write(f"{line}\n")
+    
+    def flush(self):
+        """Write all deferred tracking lines, with a single write per file."""
+        pending, self._pending_lines = self._pending_lines, {}
+        self._pending_line_count = 0
+        for file_path, lines in pending.items():
+            try:
+                self._get_tracking_handle(file_path).write(
+                    "".join(f"{line}\n" for line in lines)
+                )
+            except Exception as e:
+                console.print(f"[yellow]Warning: Could not write {file_path.name}: {e}[/yellow]")
     
     def _load_downloaded_urls(self) -> Set[str]:
         """Load set of already downloaded file URLs."""
@@ -48,8 +299,8 @@ class PodcastHandler:
             return set()
         
         try:
-            with open(self.downloaded_files_file, 'r', encoding='utf-8') as f:
-                return {line.strip() for line in f if line.strip()}
+            text = self.downloaded_files_file.read_text(encoding='utf-8', errors='replace')
+            return {line.strip() for line in text.splitlines()} - {''}
         except Exception as e:
             console.print(f"[yellow]Warning: Could not read downloaded files list: {e}[/yellow]")
             return set()
@@ -60,8 +311,8 @@ class PodcastHandler:
             return set()
         
         try:
-            with open(self.rejected_files_file, 'r', encoding='utf-8') as f:
-                return {line.strip() for line in f if line.strip()}
+            text = self.rejected_files_file.read_text(encoding='utf-8', errors='replace')
+            return {line.strip() for line in text.splitlines()} - {''}
         except Exception as e:
             console.print(f"[yellow]Warning: Could not read rejected files list: {e}[/yellow]")
             return set()
@@ -69,8 +320,7 @@ class PodcastHandler:
     def _save_downloaded_url(self, url: str):
         """Save a downloaded URL to the tracking file."""
         try:
-            with open(self.downloaded_files_file, 'a', encoding='utf-8') as f:
-                f.write(f"{url}\n")
+            self._append_line(self.downloaded_files_file, url)
             self.downloaded_urls.add(url)
         except Exception as e:
             console.print(f"[yellow]Warning: Could not save downloaded URL: {e}[/yellow]")
@@ -78,8 +328,7 @@ class PodcastHandler:
     def _save_rejected_url(self, url: str):
         """Save a rejected URL to the tracking file."""
         try:
-            with open(self.rejected_files_file, 'a', encoding='utf-8') as f:
-                f.write(f"{url}\n")
+            self._append_line(self.rejected_files_file, url)
             self.rejected_urls.add(url)
         except Exception as e:
             console.print(f"[yellow]Warning: Could not save rejected URL: {e}[/yellow]")
@@ -98,15 +347,15 @@ class PodcastHandler:
         
         try:
             url_to_number = {}
-            with open(self.url_mapping_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if '|' in line:
-                        url, number_str = line.split('|', 1)
-                        try:
-                            url_to_number[url] = int(number_str)
-                        except ValueError:
-                            continue
+            text = self.url_mapping_file.read_text(encoding='utf-8', errors='replace')
+            for line in text.splitlines():
+                line = line.strip()
+                if '|' in line:
+                    url, number_str = line.split('|', 1)
+                    try:
+                        url_to_number[url] = int(number_str)
+                    except ValueError:
+                        continue
             return url_to_number
         except Exception as e:
             console.print(f"[yellow]Warning: Could not read URL mapping: {e}[/yellow]")
@@ -115,12 +364,187 @@ class PodcastHandler:
     def _save_url_mapping(self, url: str, number: int):
         """Save URL to number mapping."""
         try:
-            with open(self.url_mapping_file, 'a', encoding='utf-8') as f:
-                f.write(f"{url}|{number}\n")
+            self._append_line(self.url_mapping_file, f"{url}|{number}")
             self.url_to_number[url] = number
+            self.number_to_url[number] = url
         except Exception as e:
             console.print(f"[yellow]Warning: Could not save URL mapping: {e}[/yellow]")
     
+    def _load_content_hashes(self) -> Dict[str, Path]:
+        """
+        Load SHA-256 hashes of downloaded episodes.
+        
+        Format: HEXDIGEST|PATH (path relative to the podcast folder)
+        
+        Returns:
+            Dictionary mapping hex digest to file path
+        """
+        if not self.content_hashes_file.exists():
+            return {}
+        
+        try:
+            content_hashes = {}
+            text = self.content_hashes_file.read_text(encoding='utf-8', errors='replace')
+            for line in text.splitlines():
+                if '|' in line:
+                    digest, relative_path = line.split('|', 1)
+                    content_hashes[digest] = self.folder_path / relative_path
+            return content_hashes
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not read content hashes: {e}[/yellow]")
+            return {}
+    
+    def _save_content_hash(self, digest: str, file_path: Path):
+        """Save the SHA-256 hash of a downloaded episode."""
+        try:
+            self._append_line(self.content_hashes_file, f"{digest}|{self._relative_key(file_path)}")
+            self.content_hashes[digest] = file_path
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not save content hash: {e}[/yellow]")
+    
+    def _find_duplicate(self, digest: str, file_path: Path) -> Optional[Path]:
+        """
+        Find an existing episode with the same content as a downloaded file.
+        
+        Args:
+            digest: SHA-256 hex digest of the downloaded file
+            file_path: The downloaded file
+            
+        Returns:
+            Path of the existing episode, or None if there is none
+        """
+        existing = self.content_hashes.get(digest)
+        if existing is None or existing == file_path or not existing.exists():
+            return None
+        return existing
+    
+    def _load_feed_cache(self, feed_url: str) -> Dict[str, str]:
+        """
+        Load the cached HTTP validators (ETag / Last-Modified) for a feed.
+        
+        A 304 answer skips all per-episode work, so the validators are only
+        used while the local state they were saved with is unchanged (see
+        _local_state_fingerprint).
+        
+        Args:
+            feed_url: URL of the RSS feed
+            
+        Returns:
+            Dictionary with optional 'etag' and 'modified' keys; empty if the
+            cache is missing, unreadable, belongs to a different feed URL or
+            the local state changed since it was saved
+        """
+        if not self.feed_cache_file.exists():
+            return {}
+        
+        try:
+            data = _json_loads(self.feed_cache_file.read_bytes())
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not read feed cache: {e}[/yellow]")
+            return {}
+        
+        if not isinstance(data, dict) or data.get('feed_url') != feed_url:
+            return {}
+        if data.get('local_state') != self._local_state_fingerprint():
+            return {}
+        return data
+    
+    def _local_state_fingerprint(self) -> List:
+        """
+        Describe the local state that decides which feed episodes are downloaded.
+        
+        Covers the minimum duration (itunes:duration skips), manual edits of
+        the rejected list and URL mapping, and the episode numbers present
+        locally (deleted episodes are downloaded again).
+        
+        Returns:
+            JSON-serializable list; equal lists mean an unchanged feed needs
+            no work
+        """
+        tracking_files = []
+        for file_path in (self.rejected_files_file, self.url_mapping_file):
+            try:
+                stat = file_path.stat()
+                tracking_files.append([stat.st_size, stat.st_mtime_ns])
+            except OSError:
+                tracking_files.append(None)
+        return [self.min_duration, tracking_files, sorted(self.local_files_by_number)]
+    
+    def _save_feed_cache(self, feed_url: str, feed=None):
+        """
+        Save the HTTP validators of a fetched feed, or clear the cache.
+        
+        Args:
+            feed_url: URL of the RSS feed
+            feed: Parsed feed whose validators to store; None clears the cache
+                so that the next update fetches the full feed again
+        """
+        data = {'feed_url': feed_url}
+        if feed is not None:
+            for key in ('etag', 'modified'):
+                value = feed.get(key)
+                if isinstance(value, str):
+                    data[key] = value
+        
+        try:
+            if len(data) == 1:
+                try:
+                    self.feed_cache_file.unlink()
+                except FileNotFoundError:
+                    pass
+                return
+            # Deferred tracking lines must be on disk before their files are
+            # stat()ed for the fingerprint
+            self.flush()
+            data['local_state'] = self._local_state_fingerprint()
+            self.feed_cache_file.write_bytes(_json_dumps(data))
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not save feed cache: {e}[/yellow]")
+    
+    def _load_duration_cache(self) -> Dict[str, List]:
+        """
+        Load cached MP3 durations.
+        
+        Format: JSON object mapping the file path (relative to the podcast
+        folder) to [mtime_ns, size, duration]
+        
+        Returns:
+            Dictionary mapping relative path to cache entry
+        """
+        if not self.duration_cache_file.exists():
+            return {}
+        
+        try:
+            data = _json_loads(self.duration_cache_file.read_bytes())
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not read duration cache: {e}[/yellow]")
+            return {}
+        
+        return data if isinstance(data, dict) else {}
+    
+    def _save_duration_cache(self):
+        """Write the duration cache back to disk if it changed."""
+        if not self._duration_cache_dirty:
+            return
+        
+        try:
+            self.duration_cache_file.write_bytes(_json_dumps(self._duration_cache))
+            self._duration_cache_dirty = False
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not save duration cache: {e}[/yellow]")
+    
+    def _relative_key(self, file_path: Path) -> str:
+        """Get the path of a file relative to the podcast folder, as cache key."""
+        try:
+            return file_path.relative_to(self.folder_path).as_posix()
+        except ValueError:
+            return str(file_path)
+    
+    def _forget_duration(self, file_path: Path):
+        """Drop the cached duration of a file that is being deleted."""
+        if self._duration_cache.pop(self._relative_key(file_path), None) is not None:
+            self._duration_cache_dirty = True
+    
     def _scan_local_files(self) -> Dict[int, Path]:
         """
         Scan local files and extract their three-digit prefixes.
@@ -133,7 +557,7 @@ class PodcastHandler:
         
         for file_path in mp3_files:
             # Check if filename starts with three digits followed by underscore
-            match = re.match(r'^(\d{3})_', file_path.name)
+            match = _NUMBER_PREFIX_RE.match(file_path.name)
             if match:
                 number = int(match.group(1))
                 local_files[number] = file_path
@@ -173,7 +597,7 @@ class PodcastHandler:
         base_filename = self._get_filename_from_url(url, episode_title)
         
         # Remove any existing three-digit prefix
-        base_filename = re.sub(r'^\d{3}_', '', base_filename)
+        base_filename = _NUMBER_PREFIX_RE.sub('', base_filename)
         
         # Add three-digit prefix
         return f"{number:03d}_{base_filename}"
@@ -189,11 +613,33 @@ class PodcastHandler:
             Duration in seconds, or 0.0 if unable to read
         """
         try:
-            audio = MP3(file_path)
-            return audio.info.length
+            stat = file_path.stat()
+        except OSError as e:
+            console.print(f"[yellow]Warning: Could not read duration of {file_path.name}: {e}[/yellow]")
+            return 0.0
+        
+        # Durations are cached until the file's mtime or size changes
+        key = self._relative_key(file_path)
+        cached = self._duration_cache.get(key)
+        if (
+            isinstance(cached, list) and len(cached) == 3
+            and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size
+        ):
+            return cached[2]
+        
+        try:
+            # Parse only the MPEG stream info (Xing/VBRI header or first
+            # frames); ID3 tags such as embedded cover art are skipped
+            with open(file_path, 'rb') as f:
+                duration = MPEGInfo(f).length
         except (MutagenError, Exception) as e:
             console.print(f"[yellow]Warning: Could not read duration of {file_path.name}: {e}[/yellow]")
             return 0.0
+        
+        with self._state_lock:
+            self._duration_cache[key] = [stat.st_mtime_ns, stat.st_size, duration]
+            self._duration_cache_dirty = True
+        return duration
     
     def _is_file_too_short(self, file_path: Path) -> bool:
         """
@@ -227,12 +673,12 @@ class PodcastHandler:
         if not filename.endswith('.mp3') or not filename:
             if episode_title:
                 # Clean episode title for filename
-                safe_title = "".join(c for c in episode_title if c.isalnum() or c in (' ', '-', '_')).strip()
+                safe_title = _UNSAFE_TITLE_RE.sub('', episode_title).strip()
                 safe_title = safe_title.replace(' ', '_')
                 filename = f"{safe_title}.mp3"
             else:
-                # Fallback: use hash of URL
-                url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+                # Fallback: use a (non-cryptographic) checksum of the URL
+                url_hash = f"{zlib.crc32(url.encode()):08x}"
                 filename = f"episode_{url_hash}.mp3"
         
         # Ensure .mp3 extension
@@ -245,25 +691,54 @@ class PodcastHandler:
         """
         Download new episodes from RSS feed.
         
+        The tracking lines of a downloaded episode (URL mapping, downloaded
+        URL, content hash) are written as soon as it is recorded, so a hard
+        kill (e.g. SIGKILL) cannot leave finished episodes behind that are
+        downloaded again under a new number. Only a download killed while its
+        duration is read, after it got its final name, can still be missed.
+        Other updates (rejected URLs) are collected and written every
+        TRACKING_FLUSH_INTERVAL lines and at the end, also if the run fails.
+        
         Args:
             feed_url: URL of the RSS feed
             
         Returns:
             List of Path objects for downloaded files
         """
+        self._defer_tracking_writes = True
+        try:
+            return self._download_new_episodes(feed_url)
+        finally:
+            self._defer_tracking_writes = False
+            self.flush()
+    
+    def _download_new_episodes(self, feed_url: str) -> List[Path]:
+        """Fetch the feed and download new episodes (see download_episodes)."""
         console.print(f"[cyan]Fetching RSS feed:[/cyan] {feed_url}")
         
+        # Conditional GET: the server answers 304 if the feed did not change
+        feed_cache = self._load_feed_cache(feed_url)
+        
         try:
-            feed = feedparser.parse(feed_url)
+            feed = feedparser.parse(
+                feed_url,
+                etag=feed_cache.get('etag'),
+                modified=feed_cache.get('modified')
+            )
         except Exception as e:
             console.print(f"[red]Error parsing RSS feed: {e}[/red]")
             return []
         
+        if feed.get('status') == 304:
+            console.print("  [dim]Feed not modified since last update[/dim]")
+            return []
+        
         if feed.bozo:
             console.print(f"[yellow]Warning: RSS feed parsing had issues: {feed.bozo_exception}[/yellow]")
         
         if not feed.entries:
             console.print("[yellow]No entries found in RSS feed[/yellow]")
+            self._save_feed_cache(feed_url, feed)
             return []
         
         console.print(f"  Found {len(feed.entries)} episode(s) in feed")
@@ -272,36 +747,22 @@ class PodcastHandler:
         # Feed entries are usually newest first, so reverse to get chronological
         feed_entries = list(reversed(feed.entries))
         
-        # Build URL to entry mapping for lookup
-        url_to_entry = {}
+        # Find each entry's audio URL once; entries without audio are dropped
+        entries_with_url = []
         for entry in feed_entries:
-            mp3_url = None
-            if hasattr(entry, 'enclosures'):
-                for enclosure in entry.enclosures:
-                    if enclosure.get('type', '').startswith('audio/'):
-                        mp3_url = enclosure.get('href')
-                        break
-            if not mp3_url and hasattr(entry, 'links'):
-                for link in entry.links:
-                    if link.get('type', '').startswith('audio/'):
-                        mp3_url = link.get('href')
-                        break
+            mp3_url = _extract_audio_url(entry)
             if mp3_url:
-                url_to_entry[mp3_url] = entry
+                entries_with_url.append((entry, mp3_url))
         
         # Build set of URLs in current feed
-        feed_urls = set(url_to_entry.keys())
+        feed_urls = {mp3_url for _, mp3_url in entries_with_url}
         
         # Find numbers used by local files NOT in feed (to preserve their numbering)
         # These are files that exist locally but their URLs are no longer in the feed
         numbers_reserved_by_orphaned_files = set()
         for number, file_path in self.local_files_by_number.items():
             # Check if this number maps to a URL not in the current feed
-            url_for_number = None
-            for url, num in self.url_to_number.items():
-                if num == number:
-                    url_for_number = url
-                    break
+            url_for_number = self.number_to_url.get(number)
             
             if url_for_number is None or url_for_number not in feed_urls:
                 # This number is used by a file not in feed (or unmapped), reserve it
@@ -309,33 +770,22 @@ class PodcastHandler:
                 numbers_reserved_by_orphaned_files.add(number)
         
         downloaded_files = []
+        download_jobs = []
         new_episodes = 0
         current_number = 1
+        # Only cache the feed validators if every entry was handled, otherwise
+        # a 304 on the next run would hide episodes that still need a download
+        all_entries_handled = True
+        
+        # Drop already rejected (too short) episodes up front. Episodes that are
+        # already downloaded stay in, they advance current_number below
+        entries_to_consider = [
+            (entry, mp3_url) for entry, mp3_url in entries_with_url
+            if mp3_url not in self.rejected_urls
+        ]
         
         # Process entries in chronological order (oldest first)
-        for entry in feed_entries:
-            # Find MP3 enclosure
-            mp3_url = None
-            if hasattr(entry, 'enclosures'):
-                for enclosure in entry.enclosures:
-                    if enclosure.get('type', '').startswith('audio/'):
-                        mp3_url = enclosure.get('href')
-                        break
-            
-            # Fallback: check links
-            if not mp3_url and hasattr(entry, 'links'):
-                for link in entry.links:
-                    if link.get('type', '').startswith('audio/'):
-                        mp3_url = link.get('href')
-                        break
-            
-            if not mp3_url:
-                continue
-            
-            # Skip if already rejected (too short)
-            if mp3_url in self.rejected_urls:
-                continue
-            
+        for entry, mp3_url in entries_to_consider:
             episode_title = entry.get('title', 'Unknown Episode')
             
             # Check if URL matches an existing local file
@@ -350,6 +800,26 @@ class PodcastHandler:
                     current_number = assigned_number + 1
                 continue
             
+            # Skip episodes the feed itself lists as too short, but only if the
+            # enclosure size agrees: some feeds put minutes into the seconds
+            # field, and those episodes would be skipped on every run. Skips
+            # are not recorded as rejected, so a corrected feed is picked up
+            feed_duration = _parse_itunes_duration(entry.get('itunes_duration'))
+            feed_length = (
+                _extract_audio_length(entry, mp3_url)
+                if feed_duration is not None and feed_duration < self.min_duration
+                else None
+            )
+            if (
+                feed_length is not None
+                and feed_length <= feed_duration * MAX_MP3_BITRATE / 8 + MAX_ID3_TAG_SIZE
+            ):
+                console.print(
+                    f"  [dim]Skipping {episode_title} (too short according to feed: "
+                    f"{feed_duration:.1f}s)[/dim]"
+                )
+                continue
+            
             # Assign number for new download chronologically
             # Skip numbers reserved by files not in feed
             while current_number in numbers_reserved_by_orphaned_files:
@@ -359,6 +829,7 @@ class PodcastHandler:
                     break
             
             if current_number > 999:
+                all_entries_handled = False
                 continue
             
             assigned_number = current_number
@@ -371,102 +842,224 @@ class PodcastHandler:
             # Ensure file doesn't exist (shouldn't happen, but safety check)
             if dest_file.exists():
                 console.print(f"  [yellow]Warning: File {dest_file.name} already exists, skipping[/yellow]")
+                all_entries_handled = False
                 continue
             
-            console.print(f"\n[yellow]Downloading:[/yellow] {episode_title}")
-            console.print(f"  URL: {mp3_url}")
-            console.print(f"  Saving as: {dest_file.name}")
+            download_jobs.append((mp3_url, episode_title, assigned_number, dest_file))
+        
+        # Download concurrently; numbers and filenames are already fixed above,
+        # so the result does not depend on the order downloads complete in
+        if download_jobs:
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                DownloadColumn(),
+                TextColumn("•"),
+                TransferSpeedColumn(),
+                TextColumn("•"),
+                TimeRemainingColumn(),
+                console=console,
+            ) as progress:
+                with ThreadPoolExecutor(max_workers=self.download_workers) as executor:
+                    futures = [
+                        executor.submit(self._download_episode, progress, *job)
+                        for job in download_jobs
+                    ]
+                    try:
+                        for future, (_, episode_title, _, _) in zip(futures, download_jobs):
+                            try:
+                                dest_file = future.result()
+                            except Exception as e:
+                                console.print(f"  [red]✗ Error downloading {episode_title}: {e}[/red]")
+                                all_entries_handled = False
+                                continue
+                            if dest_file is not None:
+                                downloaded_files.append(dest_file)
+                                new_episodes += 1
+                    except BaseException:
+                        # e.g. Ctrl-C: leaving the with block waits for every
+                        # queued download, so cancel those that have not
+                        # started yet; only the running ones finish
+                        for future in futures:
+                            future.cancel()
+                        raise
+        
+        if new_episodes > 0:
+            console.print(f"\n[green]Downloaded {new_episodes} new episode(s)[/green]")
+        else:
+            console.print("\n[yellow]No new episodes to download[/yellow]")
+        
+        self._save_feed_cache(feed_url, feed if all_entries_handled else None)
+        
+        return downloaded_files
+    
+    def _download_episode(
+        self,
+        progress: Progress,
+        mp3_url: str,
+        episode_title: str,
+        number: int,
+        dest_file: Path
+    ) -> Optional[Path]:
+        """
+        Download a single episode and record it in the tracking files.
+        
+        Runs in a worker thread of download_episodes.
+        
+        Args:
+            progress: Shared progress display to add a download task to
+            mp3_url: URL of the episode
+            episode_title: Episode title (for display)
+            number: Three-digit number assigned to the episode
+            dest_file: Path to save the episode to
+            
+        Returns:
+            Path of the downloaded file, or None if it was rejected as too
+            short or has the same content as an existing episode
             
+        Raises:
+            Exception: If the download fails (the partial file is removed)
+        """
+        console.print(f"\n[yellow]Downloading:[/yellow] {episode_title}")
+        console.print(f"  URL: {mp3_url}")
+        console.print(f"  Saving as: {dest_file.name}")
+        
+        task = progress.add_task(f"Downloading {dest_file.name}", total=None)
+        # Hash while streaming, so duplicates are found without reading the file again
+        content_hash = hashlib.sha256()
+        # Download to a hidden file first, so an interrupted download never
+        # leaves a partial numbered episode behind
+        part_file = dest_file.with_name(f".{dest_file.name}.part")
+        downloaded_size = 0
+        try:
+            response = self._get_session().get(
+                mp3_url, stream=True, timeout=DOWNLOAD_TIMEOUT
+            )
             try:
-                response = requests.get(mp3_url, stream=True, timeout=30)
                 response.raise_for_status()
                 
                 total_size = int(response.headers.get('content-length', 0))
-                
-                # Download with progress bar
-                with open(dest_file, 'wb') as f:
-                    with Progress(
-                        TextColumn("[progress.description]{task.description}"),
-                        BarColumn(),
-                        DownloadColumn(),
-                        TextColumn("•"),
-                        TransferSpeedColumn(),
-                        TextColumn("•"),
-                        TimeRemainingColumn(),
-                        console=console,
-                    ) as progress:
-                        task = progress.add_task(
-                            f"Downloading {dest_file.name}",
-                            total=total_size if total_size > 0 else None
+                if total_size > 0:
+                    # Reject episodes that are too short before fetching the
+                    # body (only if the length is that of the MP3 itself)
+                    max_duration = total_size * 8 / MIN_MP3_BITRATE
+                    if (
+                        max_duration < self.min_duration
+                        and response.headers.get('content-encoding', 'identity') == 'identity'
+                    ):
+                        console.print(
+                            f"  [yellow]⚠ File too short (at most {max_duration:.1f}s < "
+                            f"{self.min_duration:.1f}s), skipping:[/yellow] {dest_file.name}"
                         )
-                        
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                                if total_size > 0:
-                                    progress.update(task, advance=len(chunk))
-                
-                # Check duration after download
-                duration = self._get_mp3_duration(dest_file)
-                
-                if duration > 0 and duration < self.min_duration:
-                    # File is too short, delete it and mark as rejected
-                    console.print(
-                        f"  [yellow]⚠ File too short ({duration:.1f}s < {self.min_duration:.1f}s), "
-                        f"discarding:[/yellow] {dest_file.name}"
-                    )
-                    dest_file.unlink()
-                    self._save_rejected_url(mp3_url)
-                    continue
+                        with self._state_lock:
+                            self._save_rejected_url(mp3_url)
+                        return None
+                    progress.update(task, total=total_size)
                 
+                with open(part_file, 'wb', buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if chunk:
+                            f.write(chunk)
+                            content_hash.update(chunk)
+                            downloaded_size += len(chunk)
+                            if total_size > 0:
+                                progress.update(task, advance=len(chunk))
+            finally:
+                # Release the connection back to the session's pool
+                response.close()
+            os.replace(part_file, dest_file)
+        except Exception:
+            # Clean up partial file (unlink(missing_ok=True) needs Python 3.8)
+            try:
+                part_file.unlink()
+            except FileNotFoundError:
+                pass
+            raise
+        finally:
+            progress.remove_task(task)
+        
+        # Check duration after download
+        duration = self._get_mp3_duration(dest_file)
+        
+        if duration > 0 and duration < self.min_duration:
+            # File is too short, delete it and mark as rejected
+            console.print(
+                f"  [yellow]⚠ File too short ({duration:.1f}s < {self.min_duration:.1f}s), "
+                f"discarding:[/yellow] {dest_file.name}"
+            )
+            with self._state_lock:
+                self._forget_duration(dest_file)
+                dest_file.unlink()
+                self._save_rejected_url(mp3_url)
+            return None
+        
+        with self._state_lock:
+            # Feeds re-announce episodes under new (e.g. CDN) URLs; keep only
+            # the existing copy and map the new URL to its number
+            digest = content_hash.hexdigest()
+            existing_file = self._find_duplicate(digest, dest_file)
+            if existing_file is not None:
                 console.print(
-                    f"  [green]✓ Downloaded:[/green] {dest_file.name} "
-                    f"({format_file_size(dest_file.stat().st_size)}, {duration:.1f}s)"
+                    f"  [dim]Same content as {existing_file.name}, "
+                    f"discarding:[/dim] {dest_file.name}"
                 )
-                downloaded_files.append(dest_file)
+                self._forget_duration(dest_file)
+                dest_file.unlink()
                 self._save_downloaded_url(mp3_url)
-                self._save_url_mapping(mp3_url, assigned_number)
-                # Update local files tracking
-                self.local_files_by_number[assigned_number] = dest_file
-                new_episodes += 1
-                
-            except Exception as e:
-                console.print(f"  [red]✗ Error downloading {episode_title}: {e}[/red]")
-                # Clean up partial file
-                if dest_file.exists():
-                    dest_file.unlink()
-                continue
-        
-        if new_episodes > 0:
-            console.print(f"\n[green]Downloaded {new_episodes} new episode(s)[/green]")
-        else:
-            console.print("\n[yellow]No new episodes to download[/yellow]")
+                match = _NUMBER_PREFIX_RE.match(existing_file.name)
+                if match:
+                    self._save_url_mapping(mp3_url, int(match.group(1)))
+                self.flush()
+                return None
+            
+            self._save_content_hash(digest, dest_file)
+            self._save_downloaded_url(mp3_url)
+            self._save_url_mapping(mp3_url, number)
+            # The file already has its final name; without these lines on
+            # disk, a killed run would treat it as an orphan next time
+            self.flush()
+            # Update local files tracking
+            self.local_files_by_number[number] = dest_file
         
-        return downloaded_files
+        console.print(
+            f"  [green]✓ Downloaded:[/green] {dest_file.name} "
+            f"({format_file_size(downloaded_size)}, {duration:.1f}s)"
+        )
+        return dest_file
     
     def get_local_files(self) -> List[Path]:
         """
         Get all local MP3 files in the podcast folder.
         Removes any files that are too short.
         
+        Durations are read concurrently (scan_workers threads); the files
+        are then removed one by one.
+        
         Returns:
             List of MP3 file paths, sorted naturally
         """
         mp3_files = find_mp3_files(self.folder_path, recursive=True)
         
+        if self.scan_workers > 1 and len(mp3_files) > 1:
+            with ThreadPoolExecutor(max_workers=self.scan_workers) as executor:
+                durations = list(executor.map(self._get_mp3_duration, mp3_files))
+        else:
+            durations = [self._get_mp3_duration(f) for f in mp3_files]
+        
         # Check existing files and remove any that are too short
-        files_to_remove = []
-        for file_path in mp3_files:
-            if self._is_file_too_short(file_path):
-                duration = self._get_mp3_duration(file_path)
+        kept_files = []
+        for file_path, duration in zip(mp3_files, durations):
+            if duration > 0 and duration < self.min_duration:
                 console.print(
                     f"[yellow]Removing too-short file ({duration:.1f}s):[/yellow] {file_path.name}"
                 )
+                self._forget_duration(file_path)
                 file_path.unlink()
-                files_to_remove.append(file_path)
+            else:
+                kept_files.append(file_path)
         
         # Return files that are not too short
-        return [f for f in mp3_files if f not in files_to_remove]
+        return kept_files
 
 
 def process_podcast(
@@ -481,7 +1074,8 @@ def process_podcast(
     Args:
         folder_path: Path to the podcast folder
         feed_url: URL of the RSS feed
-        update: If True, download new episodes from feed
+        update: If True, download new episodes from feed and remove local
+            files shorter than min_duration
         min_duration: Minimum duration in seconds for keeping files (default: 60.0)
         
     Returns:
@@ -491,12 +1085,14 @@ def process_podcast(
     if min_duration != DEFAULT_MIN_DURATION_SECONDS:
         console.print(f"  [dim]Minimum duration: {min_duration:.1f} seconds[/dim]")
     
-    handler = PodcastHandler(folder_path, min_duration=min_duration)
-    
     if update:
-        handler.download_episodes(feed_url)
-    
-    mp3_files = handler.get_local_files()
+        with PodcastHandler(folder_path, min_duration=min_duration) as handler:
+            handler.download_episodes(feed_url)
+            mp3_files = handler.get_local_files()
+    else:
+        # Without --update the folder is taken as is: no tracking state is
+        # loaded and no durations are checked
+        mp3_files = find_mp3_files(folder_path, recursive=True)
     
     if not mp3_files:
         console.print(f"  [yellow]No MP3 files found in {folder_path.name}[/yellow]")
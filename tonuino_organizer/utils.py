@@ -1,8 +1,21 @@
 """Utility functions for file operations and validation."""
 
+import os
 import re
+import time
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
+
+# Splits a name into alternating non-digit / digit runs for natural sorting
+_NATURAL_SPLIT_RE = re.compile(r'(\d+)')
+
+# Results of find_mp3_files by (directory, recursive), together with the
+# mtimes of all directories that were listed for them
+_find_cache: Dict[Tuple[str, bool], Tuple[Dict[str, int], List[Path]]] = {}
+
+# Directories modified less than this long before a scan may still change
+# within their mtime granularity (2 s on FAT), so such scans are not cached
+_FIND_CACHE_RACY_NS = 2_000_000_000
 
 
 def expand_path(path: str) -> Path:
@@ -10,9 +23,16 @@ def expand_path(path: str) -> Path:
     return Path(path).expanduser()
 
 
+def _is_mp3_name(name: str) -> bool:
+    """Check if a file name has an .mp3 extension (case-insensitive)."""
+    # Only the last four characters are lowercased; a bare ".mp3" is a
+    # dotfile without extension, as for Path.suffix
+    return len(name) > 4 and name[-4:].lower() == ".mp3"
+
+
 def is_mp3_file(file_path: Path) -> bool:
     """Check if a file is an MP3 file."""
-    return file_path.is_file() and file_path.suffix.lower() == ".mp3"
+    return _is_mp3_name(file_path.name) and file_path.is_file()
 
 
 def natural_sort_key(text: str) -> List:
@@ -26,29 +46,94 @@ def natural_sort_key(text: str) -> List:
         "file10.mp3" -> ['file', 10, '.mp3']
         "file2.mp3" -> ['file', 2, '.mp3']
     """
-    def convert(text_part):
-        return int(text_part) if text_part.isdigit() else text_part.lower()
-    
-    return [convert(c) for c in re.split(r'(\d+)', text)]
+    return [
+        int(part) if part.isdigit() else part.lower()
+        for part in _NATURAL_SPLIT_RE.split(text)
+    ]
 
 
 def sort_files_naturally(files: List[Path]) -> List[Path]:
     """
     Sort a list of file paths naturally (alphanumerically).
     
+    Files are ordered by name; files with the same name in different
+    subdirectories are ordered by their full path, so the result does not
+    depend on the order the directories were listed in.
+    
     Args:
         files: List of Path objects to sort
         
     Returns:
         List of Path objects sorted naturally
     """
-    return sorted(files, key=lambda f: natural_sort_key(f.name))
+    # sorted() computes each key once; the path is only compared on ties
+    return sorted(files, key=lambda f: (natural_sort_key(f.name), str(f)))
+
+
+def _scandir_mp3(
+    directory: str, recursive: bool, dir_mtimes: Dict[str, int]
+) -> List[Tuple[str, str]]:
+    """
+    Collect paths of MP3 files below a directory using os.scandir.
+    
+    DirEntry caches the file type from the directory listing, so no extra
+    stat() call is needed per entry. Symlinked directories are not followed.
+    Subdirectories are walked with an explicit stack rather than recursion,
+    so deep trees neither pass every path through a chain of generators nor
+    hit the recursion limit. Directories that cannot be read or that vanish
+    during the walk are skipped, like Path.rglob does.
+    
+    Args:
+        directory: Directory to search
+        recursive: If True, descend into subdirectories
+        dir_mtimes: Receives the mtime (in ns) of every listed directory,
+            taken before it is listed; skipped directories get -1 so a
+            cached result is never reused for them
+        
+    Returns:
+        (file name, path string) of every MP3 file, in no particular order
+    """
+    mp3_paths = []
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        try:
+            dir_mtimes[current] = os.stat(current).st_mtime_ns
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                    elif _is_mp3_name(entry.name) and entry.is_file():
+                        mp3_paths.append((entry.name, entry.path))
+        except (PermissionError, FileNotFoundError):
+            # Fixing the permissions does not change the mtime, so make sure
+            # the next call lists this directory again
+            dir_mtimes[current] = -1
+            continue
+    return mp3_paths
+
+
+def _directories_unchanged(dir_mtimes: Dict[str, int]) -> bool:
+    """Check that none of the given directories changed since their mtime was taken."""
+    try:
+        return all(
+            os.stat(directory).st_mtime_ns == mtime_ns
+            for directory, mtime_ns in dir_mtimes.items()
+        )
+    except OSError:
+        return False
 
 
 def find_mp3_files(directory: Path, recursive: bool = True) -> List[Path]:
     """
     Find all MP3 files in a directory.
     
+    Results are cached in memory. Adding, removing or renaming an entry
+    changes the mtime of its directory, so a cached result is reused only
+    while every directory it was built from still has the same mtime,
+    which costs one stat() per directory instead of a new listing.
+    
     Args:
         directory: Directory to search
         recursive: If True, search recursively in subdirectories
@@ -59,18 +144,42 @@ def find_mp3_files(directory: Path, recursive: bool = True) -> List[Path]:
     if not directory.exists() or not directory.is_dir():
         return []
     
-    mp3_files = []
+    key = (os.fspath(directory), recursive)
+    cached = _find_cache.get(key)
+    if cached is not None and _directories_unchanged(cached[0]):
+        return list(cached[1])
     
-    if recursive:
-        for file_path in directory.rglob("*.mp3"):
-            if is_mp3_file(file_path):
-                mp3_files.append(file_path)
+    scan_started_ns = time.time_ns()
+    dir_mtimes: Dict[str, int] = {}
+    # Sorted as strings (same order as sort_files_naturally, which needs
+    # Path.name per file); Path objects are only built for the result
+    found = _scandir_mp3(key[0], recursive, dir_mtimes)
+    found.sort(key=lambda item: (natural_sort_key(item[0]), item[1]))
+    mp3_files = [Path(path) for _, path in found]
+    
+    if max(dir_mtimes.values()) < scan_started_ns - _FIND_CACHE_RACY_NS:
+        _find_cache[key] = (dir_mtimes, mp3_files)
     else:
-        for file_path in directory.glob("*.mp3"):
-            if is_mp3_file(file_path):
-                mp3_files.append(file_path)
+        _find_cache.pop(key, None)
     
-    return sort_files_naturally(mp3_files)
+    return list(mp3_files)
+
+
+find_mp3_files.cache_clear = _find_cache.clear
+
+
+def has_two_digit_prefix(folder_name: str) -> bool:
+    """
+    Check if a folder name starts with exactly two digits followed by underscore.
+    
+    Args:
+        folder_name: Name of the folder (e.g., "01_MyAlbum")
+        
+    Returns:
+        True if the name has a valid two-digit prefix
+    """
+    # Plain string checks; isdecimal() matches exactly what regex \d does
+    return len(folder_name) >= 3 and folder_name[2] == '_' and folder_name[:2].isdecimal()
 
 
 def extract_two_digit_prefix(folder_name: str) -> str:
@@ -87,10 +196,12 @@ def extract_two_digit_prefix(folder_name: str) -> str:
         ValueError: If folder name doesn't start with exactly two digits followed by underscore
     """
     # Must start with exactly two digits followed by underscore
-    match = re.match(r'^(\d{2})_', folder_name)
-    if not match:
+    if not has_two_digit_prefix(folder_name):
         raise ValueError(f"Folder name '{folder_name}' does not start with a two-digit prefix")
-    return match.group(1)
+    return folder_name[:2]
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -103,9 +214,11 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Human-readable size string (e.g., "1.5 MB", "256 KB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    # Every unit is 2**10 times the previous one, so the unit follows from the
+    # bit length. Dividing by a power of two once gives the same float as
+    # dividing by 1024 repeatedly
+    index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
 